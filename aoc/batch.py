@@ -0,0 +1,92 @@
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+import json
+import os
+import tarfile
+import time
+from typing import Iterable, Iterator, TextIO
+
+from .cache import Answer
+from .solution import load_solution
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    day: str
+    input: str
+    answer_1: Answer | None
+    answer_2: Answer | None
+    seconds: float
+    error: str | None = None
+
+
+def iter_inputs(path: str) -> Iterator[tuple[str, str]]:
+    """Yield (name, text) for each file in a directory or tarball.
+
+    Tarballs are read as a stream, so only one input is in memory at once.
+    """
+    if os.path.isdir(path):
+        for name in sorted(os.listdir(path)):
+            file_path = os.path.join(path, name)
+            if os.path.isfile(file_path):
+                with open(file_path, 'r') as f:
+                    yield name, f.read()
+        return
+    with tarfile.open(path, mode='r|*') as tar:
+        for member in tar:
+            member_file = tar.extractfile(member) if member.isfile() else None
+            if member_file is not None:
+                yield member.name, member_file.read().decode()
+
+
+def solve_input(day: str, name: str, raw_input: str) -> BatchResult:
+    solution = load_solution(day)
+    start = time.perf_counter()
+    try:
+        answer_1, answer_2 = solution.solve(raw_input)
+    except Exception as e:
+        return BatchResult(
+            day, name, None, None, time.perf_counter() - start,
+            f'{type(e).__name__}: {e}',
+        )
+    return BatchResult(
+        day, name, answer_1, answer_2, time.perf_counter() - start
+    )
+
+
+def submit_all(
+    executor: Executor,
+    day: str,
+    inputs: Iterable[tuple[str, str]],
+    window: int,
+) -> Iterator[BatchResult]:
+    """Like executor.map, but only reads window inputs ahead."""
+    pending: deque[Future[BatchResult]] = deque()
+    for name, raw_input in inputs:
+        pending.append(executor.submit(solve_input, day, name, raw_input))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def solve_batch(
+    day: str,
+    inputs: Iterable[tuple[str, str]],
+    jobs: int = 1,
+) -> Iterator[BatchResult]:
+    if jobs == 1:
+        for name, raw_input in inputs:
+            yield solve_input(day, name, raw_input)
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        yield from submit_all(executor, day, inputs, 2 * jobs)
+
+
+def write_jsonl(results: Iterable[BatchResult], output: TextIO) -> int:
+    failures = 0
+    for result in results:
+        print(json.dumps(asdict(result)), file=output, flush=True)
+        failures += result.error is not None
+    return failures
@@ -0,0 +1,93 @@
+import glob
+import hashlib
+import json
+import os
+
+from .loader import Buffer
+
+DEFAULT_CACHE_DIR = '.aoc_cache'
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+
+Answer = int | str
+
+# Days import helpers from this package, so its code is part of theirs.
+SHARED_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def input_digest(buffer: Buffer) -> str:
+    return hashlib.sha256(buffer).hexdigest()
+
+
+def source_digest(solution_file: str, shared_dir: str = SHARED_DIR) -> str:
+    package_dir = os.path.dirname(solution_file)
+    digest = hashlib.sha256()
+    for directory in (package_dir, shared_dir):
+        for path in sorted(glob.glob(f'{directory}/*.py')):
+            digest.update(os.path.basename(path).encode())
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+
+class AnswerCache:
+    """Answers on disk, one JSON file per (day, part, input, source) key.
+
+    Reading an entry bumps its modification time, and writes evict the
+    least recently used entries once the directory is over max_bytes.
+    """
+
+    def __init__(
+        self,
+        directory: str = DEFAULT_CACHE_DIR,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def key(day: str, part: int, input_hash: str, source_hash: str) -> str:
+        return hashlib.sha256(
+            f'{day}:{part}:{input_hash}:{source_hash}'.encode()
+        ).hexdigest()
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, f'{key}.json')
+
+    def get(self, key: str) -> Answer | None:
+        path = self.path(key)
+        try:
+            with open(path, 'r') as f:
+                answer: Answer = json.load(f)['answer']
+            os.utime(path)
+        except (FileNotFoundError, ValueError, KeyError):
+            return None
+        return answer
+
+    def put(self, key: str, answer: Answer) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(key)
+        # Write then rename so concurrent workers never see half an entry.
+        temp_path = f'{path}.{os.getpid()}.tmp'
+        with open(temp_path, 'w') as f:
+            json.dump({'answer': answer}, f)
+        os.replace(temp_path, path)
+        self.evict()
+
+    def evict(self) -> None:
+        entries = []
+        for path in glob.glob(os.path.join(self.directory, '*.json')):
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+
+        total_bytes = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_bytes <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total_bytes -= size
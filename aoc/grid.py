@@ -0,0 +1,87 @@
+from typing import Iterable, Iterator
+
+import numpy as np
+import numpy.typing as np_typing
+
+from .loader import Buffer
+
+Grid = np_typing.NDArray[np.uint8]
+Point = tuple[int, int]
+
+NEWLINE = ord('\n')
+
+ORTHOGONAL = ((-1, 0), (0, -1), (1, 0), (0, 1))
+DIAGONAL = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+ADJACENT = ORTHOGONAL + DIAGONAL
+
+
+def rows(buffer: Buffer | str) -> Grid:
+    """View equal-width lines as a (height, width) array of bytes.
+
+    The view skips the newlines by striding over them, so nothing is
+    copied until the caller transforms the cells.
+    """
+    if isinstance(buffer, str):
+        buffer = buffer.encode()
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    width = buffer.find(b'\n')
+    if width == -1:
+        return data.reshape(1, -1)
+    height = (len(data) + 1) // (width + 1)
+    row_ends = data[width::width + 1]
+    if (
+        len(data) not in (height * (width + 1) - 1, height * (width + 1))
+        or np.any(row_ends != NEWLINE)
+        or np.count_nonzero(data == NEWLINE) != len(row_ends)
+    ):
+        raise ValueError('grid rows must all have the same width')
+    return np.lib.stride_tricks.as_strided(
+        data, shape=(height, width), strides=(width + 1, 1), writeable=False
+    )
+
+
+def parse_digits(buffer: Buffer | str) -> Grid:
+    # Bytes below '0' wrap around, so one bound catches every non-digit.
+    digits = rows(buffer) - np.uint8(ord('0'))
+    if np.any(digits > 9):
+        raise ValueError('grid cells must be digits')
+    return digits
+
+
+def parse_cells(buffer: Buffer | str, on: str = '#') -> Grid:
+    return (rows(buffer) == ord(on)).view(np.uint8)
+
+
+def from_points(
+    points: Iterable[Point],
+    shape: tuple[int, int] | None = None,
+) -> Grid:
+    indices = np.array(list(points)).reshape(-1, 2).T
+    if shape is None:
+        height, width = indices.max(axis=1) + 1
+        shape = int(height), int(width)
+    grid = np.zeros(shape, dtype=np.uint8)
+    grid[indices[0], indices[1]] = 1
+    return grid
+
+
+def pad(grid: Grid, value: int, width: int = 1) -> Grid:
+    return np.pad(grid, width, constant_values=value)
+
+
+def neighbors(
+    point: Point,
+    shape: tuple[int, ...],
+    offsets: tuple[Point, ...] = ORTHOGONAL,
+) -> Iterator[Point]:
+    i, j = point
+    height, width = shape
+    for di, dj in offsets:
+        if 0 <= i + di < height and 0 <= j + dj < width:
+            yield i + di, j + dj
+
+
+def render(grid: Grid, on: str = '#', off: str = '.') -> str:
+    return '\n'.join(
+        ''.join(on if cell else off for cell in row) for row in grid
+    )
@@ -0,0 +1,156 @@
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, replace
+import functools
+import importlib
+import json
+import time
+import tracemalloc
+from typing import Callable, Iterable, Iterator, TypeVar
+
+from .solution import Solution
+
+A = TypeVar('A')
+
+# Functions worth counting when a day is profiled without explicit targets.
+HOT_FUNCTIONS = {
+    'day09': ('day09.main:HeightMap.__getitem__',),
+    'day16': ('day16.main:BitQueue.take',),
+}
+
+
+@dataclass
+class Counter:
+    calls: int = 0
+    seconds: float = 0.0
+
+
+@dataclass(frozen=True)
+class Phase:
+    name: str
+    wall_seconds: float
+    cpu_seconds: float
+    peak_bytes: int
+    calls: dict[str, Counter]
+
+
+@dataclass(frozen=True)
+class Profile:
+    day: str
+    phases: list[Phase]
+
+
+def resolve(target: str) -> tuple[object, str]:
+    """Split 'package.module:Class.method' into its owner and name."""
+    module_name, _, qualname = target.partition(':')
+    owner: object = importlib.import_module(module_name)
+    *owner_path, name = qualname.split('.')
+    for attr in owner_path:
+        owner = getattr(owner, attr)
+    return owner, name
+
+
+def counted(func: object, counter: Counter) -> object:
+    if not callable(func):
+        raise TypeError(f'{func!r} is not callable')
+    # Bound after the check, so the closure sees it as callable.
+    call = func
+    depth = 0
+
+    def wrapper(*args: object, **kwargs: object) -> object:
+        nonlocal depth
+        counter.calls += 1
+        # Only time the outermost call, so recursion isn't counted twice.
+        depth += 1
+        start = time.perf_counter()
+        try:
+            return call(*args, **kwargs)
+        finally:
+            depth -= 1
+            if depth == 0:
+                counter.seconds += time.perf_counter() - start
+    return functools.update_wrapper(wrapper, func)
+
+
+@contextmanager
+def counting(targets: Iterable[str]) -> Iterator[dict[str, Counter]]:
+    """Count calls to the target functions until the context exits."""
+    counters = {}
+    patches = []
+    try:
+        for target in targets:
+            owner, name = resolve(target)
+            counters[target] = Counter()
+            patches.append((owner, name, vars(owner).get(name)))
+            setattr(
+                owner, name, counted(getattr(owner, name), counters[target])
+            )
+        yield counters
+    finally:
+        for owner, name, original in reversed(patches):
+            if original is None:
+                delattr(owner, name)
+            else:
+                setattr(owner, name, original)
+
+
+def measure(
+    name: str,
+    func: Callable[[], A],
+    counters: dict[str, Counter],
+) -> tuple[A, Phase]:
+    for counter in counters.values():
+        counter.calls, counter.seconds = 0, 0.0
+    tracemalloc.start()
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    try:
+        result = func()
+        wall_seconds = time.perf_counter() - wall_start
+        cpu_seconds = time.process_time() - cpu_start
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    calls = {target: replace(counter) for target, counter in counters.items()}
+    return result, Phase(name, wall_seconds, cpu_seconds, peak_bytes, calls)
+
+
+def profile_day(
+    day: str,
+    solution: Solution,
+    raw_input: str,
+    targets: Iterable[str] | None = None,
+) -> Profile:
+    hot_functions = HOT_FUNCTIONS.get(day, ()) if targets is None else targets
+    with counting(hot_functions) as counters:
+        puzzle_input, parse = measure(
+            'parse', lambda: solution.parse_input(raw_input), counters
+        )
+        _, part_1 = measure(
+            'part_1', lambda: solution.part_1(puzzle_input), counters
+        )
+        _, part_2 = measure(
+            'part_2', lambda: solution.part_2(puzzle_input), counters
+        )
+    return Profile(day, [parse, part_1, part_2])
+
+
+def to_json(profiles: Iterable[Profile]) -> str:
+    return json.dumps([asdict(profile) for profile in profiles], indent=2)
+
+
+def to_folded(profiles: Iterable[Profile]) -> Iterator[str]:
+    """Folded stacks weighted by microseconds, as flamegraph.pl reads them.
+
+    Counted functions appear as children of the phase that called them,
+    which assumes they don't call each other.
+    """
+    for profile in profiles:
+        for phase in profile.phases:
+            stack = f'{profile.day};{phase.name}'
+            phase_micros = round(phase.wall_seconds * 1e6)
+            for target, counter in phase.calls.items():
+                if not counter.calls:
+                    continue
+                micros = round(counter.seconds * 1e6)
+                phase_micros -= micros
+                yield f'{stack};{target} {micros}'
+            yield f'{stack} {max(phase_micros, 0)}'
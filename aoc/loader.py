@@ -0,0 +1,44 @@
+from contextlib import contextmanager
+import mmap
+from typing import Iterator
+
+Buffer = bytes | mmap.mmap
+
+
+@contextmanager
+def mapped(path: str) -> Iterator[Buffer]:
+    """Map a file read-only, so it is paged in on demand, never copied."""
+    with open(path, 'rb') as f:
+        try:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped.
+            yield b''
+            return
+        try:
+            yield buffer
+        except BaseException:
+            try:
+                buffer.close()
+            except BufferError:
+                # The traceback still holds views of the map, which is
+                # unmapped once they are collected.
+                pass
+            raise
+        buffer.close()
+
+
+def lines(buffer: Buffer) -> Iterator[str]:
+    """Decode lines one at a time, without their trailing newline."""
+    start = 0
+    while start < len(buffer):
+        end = buffer.find(b'\n', start)
+        if end == -1:
+            end = len(buffer)
+        yield buffer[start:end].decode()
+        start = end + 1
+
+
+def read_lines(path: str) -> Iterator[str]:
+    with mapped(path) as buffer:
+        yield from lines(buffer)
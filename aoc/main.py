@@ -0,0 +1,255 @@
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+import os
+import sys
+import time
+from typing import Callable, Iterable, Iterator
+
+from . import batch, instrument, loader
+from .cache import (
+    Answer,
+    AnswerCache,
+    DEFAULT_CACHE_DIR,
+    DEFAULT_MAX_BYTES,
+    input_digest,
+    source_digest,
+)
+from .solution import load_solution, Solution
+
+DAYS = tuple(f'day{day:02}' for day in range(23))
+
+
+@dataclass(frozen=True)
+class Result:
+    day: str
+    answer_1: Answer
+    answer_2: Answer
+    seconds: float
+    cached: bool = False
+
+
+def day_name(raw_day: str) -> str:
+    return f'day{int(raw_day.removeprefix("day")):02}'
+
+
+def input_path(day: str) -> str:
+    return f'{load_solution(day).SCRIPT_DIR}/input.txt'
+
+
+def read_input(day: str) -> str:
+    with open(input_path(day), 'r') as f:
+        return f.read()
+
+
+def parse(solution: Solution, buffer: loader.Buffer) -> object:
+    """Hand the mapped input over in whatever form the day can take."""
+    # Only some days have these, so they are not part of Solution.
+    parse_buffer: Callable[[loader.Buffer], object] | None = getattr(
+        solution, 'parse_buffer', None
+    )
+    if parse_buffer is not None:
+        return parse_buffer(buffer)
+    parse_lines: Callable[[Iterator[str]], object] | None = getattr(
+        solution, 'parse_lines', None
+    )
+    if parse_lines is not None:
+        return parse_lines(loader.lines(buffer))
+    return solution.parse_input(buffer[:].decode())
+
+
+def solve_day(day: str, cache: AnswerCache | None = None) -> Result:
+    start = time.perf_counter()
+    solution = load_solution(day)
+    parts = (solution.part_1, solution.part_2)
+
+    with loader.mapped(input_path(day)) as buffer:
+        keys = []
+        answers: list[Answer | None] = [None for _ in parts]
+        if cache is not None:
+            input_hash = input_digest(buffer)
+            source_hash = source_digest(solution.__file__)
+            keys = [
+                cache.key(day, part, input_hash, source_hash)
+                for part in range(1, len(parts) + 1)
+            ]
+            answers = [cache.get(key) for key in keys]
+        cached = None not in answers
+        if not cached:
+            puzzle_input = parse(solution, buffer)
+
+    if not cached:
+        for i, part in enumerate(parts):
+            if answers[i] is None:
+                answer = part(puzzle_input)
+                answers[i] = answer
+                if cache is not None:
+                    cache.put(keys[i], answer)
+
+    answer_1, answer_2 = answers
+    assert answer_1 is not None and answer_2 is not None
+    return Result(
+        day, answer_1, answer_2, time.perf_counter() - start, cached
+    )
+
+
+def format_answer(answer: Answer) -> str:
+    # Multi-line answers (day 13's letters) start on their own line.
+    raw_answer = str(answer)
+    return ('\n' if '\n' in raw_answer else ' ') + raw_answer
+
+
+def format_result(result: Result) -> str:
+    return '\n'.join([
+        f'{result.day} part 1:{format_answer(result.answer_1)}',
+        f'{result.day} part 2:{format_answer(result.answer_2)}',
+    ])
+
+
+def available_cores() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def job_count(raw_jobs: str) -> int:
+    jobs = int(raw_jobs)
+    if jobs < 0:
+        raise ValueError('jobs must not be negative')
+    return jobs or available_cores()
+
+
+def solve_days(
+    days: Iterable[str],
+    jobs: int = 1,
+    cache: AnswerCache | None = None,
+) -> Iterator[Result]:
+    solve = partial(solve_day, cache=cache)
+    if jobs == 1:
+        yield from map(solve, days)
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        yield from executor.map(solve, days)
+
+
+def format_report(results: list[Result], wall_seconds: float) -> str:
+    timings = [
+        f'{result.day} {result.seconds:10.3f}s'
+        + (' (cached)' if result.cached else '')
+        for result in results
+    ]
+    total_seconds = sum(result.seconds for result in results)
+    return '\n'.join(timings + [
+        f'{len(results)} days in {wall_seconds:.3f}s'
+        f' ({total_seconds:.3f}s spent solving)'
+    ])
+
+
+def run(
+    days: list[str],
+    jobs: int = 1,
+    cache: AnswerCache | None = None,
+) -> None:
+    start = time.perf_counter()
+    results = []
+    for result in solve_days(days, jobs, cache):
+        print(format_result(result))
+        results.append(result)
+    print(format_report(results, time.perf_counter() - start))
+
+
+def profile(
+    days: list[str],
+    targets: list[str] | None = None,
+    output_format: str = 'json',
+) -> None:
+    profiles = [
+        instrument.profile_day(
+            day, load_solution(day), read_input(day), targets
+        )
+        for day in days
+    ]
+    if output_format == 'json':
+        print(instrument.to_json(profiles))
+    else:
+        print('\n'.join(instrument.to_folded(profiles)))
+
+
+def solve_batch(
+    day: str,
+    inputs_path: str,
+    output_path: str | None = None,
+    jobs: int = 1,
+) -> int:
+    results = batch.solve_batch(day, batch.iter_inputs(inputs_path), jobs)
+    if output_path is None:
+        return batch.write_jsonl(results, sys.stdout)
+    with open(output_path, 'w') as output:
+        return batch.write_jsonl(results, output)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog='python -m aoc')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help='solve the bundled inputs')
+    run_parser.add_argument('days', nargs='*', type=day_name, default=DAYS)
+    run_parser.add_argument(
+        '-j', '--jobs', type=job_count, default=1,
+        help='solve days in this many processes, or 0 for all cores',
+    )
+    run_parser.add_argument(
+        '--no-cache', action='store_true',
+        help='recompute every answer instead of reusing cached ones',
+    )
+    run_parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR)
+    run_parser.add_argument(
+        '--cache-size', type=int, default=DEFAULT_MAX_BYTES,
+        help='evict least recently used answers beyond this many bytes',
+    )
+
+    profile_parser = subparsers.add_parser(
+        'profile', help='time, memory and call counts for each phase'
+    )
+    profile_parser.add_argument('days', nargs='*', type=day_name, default=DAYS)
+    profile_parser.add_argument(
+        '--count', action='append', metavar='MODULE:FUNCTION',
+        help='count calls to this function, e.g. day16.main:BitQueue.take',
+    )
+    profile_parser.add_argument(
+        '--format', choices=('json', 'folded'), default='json',
+        help='folded stacks can be fed to flamegraph.pl',
+    )
+
+    batch_parser = subparsers.add_parser(
+        'batch', help='solve every input in a directory or tarball'
+    )
+    batch_parser.add_argument('day', type=day_name)
+    batch_parser.add_argument('inputs', help='directory or tarball')
+    batch_parser.add_argument(
+        '-o', '--output', help='write JSON lines here instead of stdout'
+    )
+    batch_parser.add_argument(
+        '-j', '--jobs', type=job_count, default=1,
+        help='solve inputs in this many processes, or 0 for all cores',
+    )
+
+    args = parser.parse_args()
+    if args.command == 'run':
+        cache = (
+            None if args.no_cache
+            else AnswerCache(args.cache_dir, args.cache_size)
+        )
+        run(args.days, args.jobs, cache)
+    elif args.command == 'profile':
+        profile(args.days, args.count, args.format)
+    elif args.command == 'batch':
+        failures = solve_batch(args.day, args.inputs, args.output, args.jobs)
+        if failures:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,11 @@
+import warnings
+
+import numpy as np
+import numpy.typing as np_typing
+
+
+def parse_ints(text: str, sep: str) -> np_typing.NDArray[np.int64]:
+    with warnings.catch_warnings():
+        # numpy only warns about unparseable text, and stops reading there.
+        warnings.simplefilter('error', DeprecationWarning)
+        return np.fromstring(text, dtype=np.int64, sep=sep)
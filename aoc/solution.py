@@ -0,0 +1,26 @@
+import importlib
+from typing import cast, Protocol
+
+from .cache import Answer
+
+
+class Solution(Protocol):
+    """The module every day provides as dayNN.main."""
+    SCRIPT_DIR: str
+    __file__: str
+
+    def parse_input(self, raw_input: str) -> object:
+        ...
+
+    def part_1(self, puzzle_input: object) -> Answer:
+        ...
+
+    def part_2(self, puzzle_input: object) -> Answer:
+        ...
+
+    def solve(self, raw_input: str) -> tuple[Answer, Answer]:
+        ...
+
+
+def load_solution(day: str) -> Solution:
+    return cast(Solution, importlib.import_module(f'{day}.main'))
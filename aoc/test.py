@@ -0,0 +1,195 @@
+import os
+import subprocess
+import sys
+import tarfile
+
+import numpy as np
+import pytest
+
+from . import batch, cache, grid, instrument, loader, main, parsing
+
+
+def test_day_name() -> None:
+    assert main.day_name('5') == 'day05'
+    assert main.day_name('day22') == 'day22'
+
+
+def test_solve_day() -> None:
+    result = main.solve_day('day00')
+    assert (result.answer_1, result.answer_2) == ('hello\n', 'there\n')
+
+
+def test_job_count() -> None:
+    assert main.job_count('3') == 3
+    assert main.job_count('0') == main.available_cores()
+    with pytest.raises(ValueError):
+        main.job_count('-1')
+
+
+def test_read_lines(tmp_path: str) -> None:
+    path = os.path.join(tmp_path, 'input.txt')
+    for raw_input in ('', 'a\n', 'a\n\nbc', 'a\nbc\n'):
+        with open(path, 'w') as f:
+            f.write(raw_input)
+        assert list(loader.read_lines(path)) == raw_input.splitlines()
+
+
+def test_parse_ints() -> None:
+    assert parsing.parse_ints('3,-1,4\n', ',').tolist() == [3, -1, 4]
+    with pytest.raises(ValueError):
+        parsing.parse_ints('3,x,4', ',')
+
+
+def test_parse_digits() -> None:
+    raw_grids: list[str | bytes] = ['12\n34\n', '12\n34', b'12\n34\n']
+    for raw_grid in raw_grids:
+        parsed = grid.parse_digits(raw_grid)
+        assert parsed.dtype == np.uint8
+        assert parsed.tolist() == [[1, 2], [3, 4]]
+    for malformed in ('12\n345\n', '012\n34\n567\n', '12\n3a\n', '1\n\n\n'):
+        with pytest.raises(ValueError):
+            grid.parse_digits(malformed)
+
+
+def test_neighbors() -> None:
+    assert set(grid.neighbors((0, 1), (2, 3))) == {(0, 0), (0, 2), (1, 1)}
+    assert len(list(grid.neighbors((1, 1), (3, 3), grid.ADJACENT))) == 8
+
+
+def test_cache_round_trip(tmp_path: str) -> None:
+    answer_cache = cache.AnswerCache(str(tmp_path))
+    key = answer_cache.key('day01', 1, 'input', 'source')
+    assert answer_cache.get(key) is None
+    answer_cache.put(key, 1390)
+    assert answer_cache.get(key) == 1390
+
+
+def test_cache_evicts_least_recently_used(tmp_path: str) -> None:
+    answer_cache = cache.AnswerCache(str(tmp_path), max_bytes=30)
+    old, recent, new = (
+        answer_cache.key('day01', part, 'input', 'source')
+        for part in range(3)
+    )
+    answer_cache.put(old, 1)
+    answer_cache.put(recent, 2)
+    os.utime(answer_cache.path(old), ns=(1, 1))
+    os.utime(answer_cache.path(recent), ns=(2, 2))
+    answer_cache.get(recent)
+
+    answer_cache.put(new, 3)
+    assert answer_cache.get(old) is None
+    assert answer_cache.get(recent) == 2
+    assert answer_cache.get(new) == 3
+
+
+def test_solve_day_uses_cache(tmp_path: str) -> None:
+    answer_cache = cache.AnswerCache(str(tmp_path))
+    first = main.solve_day('day01', answer_cache)
+    second = main.solve_day('day01', answer_cache)
+    assert not first.cached
+    assert second.cached
+    assert (second.answer_1, second.answer_2) == (1390, 1457)
+
+
+def test_source_digest_covers_shared_code(tmp_path: str) -> None:
+    day_dir = os.path.join(tmp_path, 'day')
+    shared_dir = os.path.join(tmp_path, 'shared')
+    os.makedirs(day_dir)
+    os.makedirs(shared_dir)
+    solution_file = os.path.join(day_dir, 'main.py')
+    with open(solution_file, 'w') as f:
+        f.write('from shared import helper\n')
+    with open(os.path.join(shared_dir, 'helper.py'), 'w') as f:
+        f.write('ANSWER = 1\n')
+    before = cache.source_digest(solution_file, shared_dir)
+    with open(os.path.join(shared_dir, 'helper.py'), 'w') as f:
+        f.write('ANSWER = 2\n')
+    assert cache.source_digest(solution_file, shared_dir) != before
+
+    day01_file = main.load_solution('day01').__file__
+    assert cache.source_digest(day01_file) != cache.source_digest(
+        day01_file, shared_dir
+    )
+
+
+def test_profile_day_counts_hot_functions() -> None:
+    owner, name = instrument.resolve('day16.main:BitQueue.take')
+    take = getattr(owner, name)
+    profile = instrument.profile_day(
+        'day16', main.load_solution('day16'), main.read_input('day16')
+    )
+    assert getattr(owner, name) is take
+
+    parse, part_1, _ = profile.phases
+    assert parse.calls['day16.main:BitQueue.take'].calls > 0
+    assert part_1.calls['day16.main:BitQueue.take'].calls == 0
+    assert parse.peak_bytes > 0
+
+    folded = list(instrument.to_folded([profile]))
+    assert folded[0].startswith('day16;parse;day16.main:BitQueue.take ')
+    assert len(folded) == 4
+
+
+def test_solve_batch(tmp_path: str) -> None:
+    inputs_dir = os.path.join(tmp_path, 'inputs')
+    os.mkdir(inputs_dir)
+    for name, raw_input in (('a', main.read_input('day01')), ('b', '1\n')):
+        with open(os.path.join(inputs_dir, name), 'w') as f:
+            f.write(raw_input)
+    tarball = os.path.join(tmp_path, 'inputs.tar.gz')
+    with tarfile.open(tarball, 'w:gz') as tar:
+        tar.add(inputs_dir, arcname='inputs')
+
+    from_dir = list(batch.solve_batch('day01', batch.iter_inputs(inputs_dir)))
+    from_tar = list(batch.solve_batch('day01', batch.iter_inputs(tarball)))
+    assert [result.input for result in from_dir] == ['a', 'b']
+    assert sorted(result.input for result in from_tar) == [
+        'inputs/a', 'inputs/b'
+    ]
+    for results in (from_dir, from_tar):
+        answers = {
+            result.input[-1]: (result.answer_1, result.answer_2)
+            for result in results
+        }
+        assert answers == {'a': (1390, 1457), 'b': (0, 0)}
+
+
+def test_solve_days_in_parallel() -> None:
+    days = ['day00', 'day01', 'day02']
+    sequential = [
+        (result.day, result.answer_1, result.answer_2)
+        for result in main.solve_days(days)
+    ]
+    parallel = [
+        (result.day, result.answer_1, result.answer_2)
+        for result in main.solve_days(days, jobs=2)
+    ]
+    assert parallel == sequential
+
+
+def test_pure_python_days_skip_numpy() -> None:
+    imported = subprocess.run(
+        [
+            sys.executable, '-c',
+            'import sys\n'
+            'from aoc.main import solve_day\n'
+            'for day in ("day06", "day14"):\n'
+            '    solve_day(day)\n'
+            'print(sorted({"numpy", "scipy"} & set(sys.modules)))\n',
+        ],
+        capture_output=True, check=True, text=True,
+    ).stdout
+    assert imported == '[]\n'
+
+
+def test_numpy_days_skip_scipy_until_used() -> None:
+    imported = subprocess.run(
+        [
+            sys.executable, '-c',
+            'import sys\n'
+            'import day11.main, day20.main\n'
+            'print("scipy" in sys.modules)\n',
+        ],
+        capture_output=True, check=True, text=True,
+    ).stdout
+    assert imported == 'False\n'
@@ -0,0 +1,480 @@
+import argparse
+from itertools import permutations, product
+import math
+import random
+import string
+import sys
+from typing import Callable, Iterator
+
+Generator = Callable[[random.Random, int], Iterator[str]]
+
+SEVEN_SEGMENT_DIGITS = (
+    'abcefg', 'cf', 'acdeg', 'acdfg', 'bcdf',
+    'abdfg', 'abdefg', 'acf', 'abcdefg', 'abcdfg',
+)
+CLOSING_MATCH = {'(': ')', '[': ']', '{': '}', '<': '>'}
+Vector = tuple[int, int, int]
+
+
+def grid_side(bundled_side: int, scale: int) -> int:
+    return round(bundled_side * math.sqrt(scale))
+
+
+def sized(bundled_size: int, scale: int, cost_power: int) -> int:
+    """The size at which an O(n ** cost_power) solver does scale x work."""
+    return round(bundled_size * scale ** (1 / cost_power))
+
+
+def digit_grid(rng: random.Random, side: int, digits: str) -> Iterator[str]:
+    for _ in range(side):
+        yield ''.join(rng.choices(digits, k=side)) + '\n'
+
+
+def generate_day00(rng: random.Random, scale: int) -> Iterator[str]:
+    yield 'hello\n'
+    yield 'there\n'
+
+
+def generate_day01(rng: random.Random, scale: int) -> Iterator[str]:
+    depth = rng.randint(100, 200)
+    for _ in range(2000 * scale):
+        depth = max(0, depth + rng.randint(-10, 20))
+        yield f'{depth}\n'
+
+
+def generate_day02(rng: random.Random, scale: int) -> Iterator[str]:
+    for _ in range(1000 * scale):
+        direction, = rng.choices(('forward', 'down', 'up'), weights=(5, 3, 2))
+        yield f'{direction} {rng.randint(1, 9)}\n'
+
+
+def generate_day03(rng: random.Random, scale: int) -> Iterator[str]:
+    readings = 1000 * scale
+    width = max(12, readings.bit_length() + 2)
+    for reading in rng.sample(range(2 ** width), readings):
+        yield f'{reading:0{width}b}\n'
+
+
+def bingo_win_turn(board: list[int], order: dict[int, int]) -> int:
+    turns = [order[number] for number in board]
+    return min(
+        min(max(turns[5*i:5*i+5]) for i in range(5)),
+        min(max(turns[i::5]) for i in range(5)),
+    )
+
+
+def generate_day04(rng: random.Random, scale: int) -> Iterator[str]:
+    numbers = list(range(100))
+    rng.shuffle(numbers)
+    order = {number: turn for turn, number in enumerate(numbers)}
+    boards = [rng.sample(numbers, 25) for _ in range(100 * scale)]
+    turns = [bingo_win_turn(board, order) for board in boards]
+
+    # The solution expects a single first winner and a single last winner.
+    first = turns.index(min(turns))
+    last = turns.index(max(turns))
+    for i in range(len(boards)):
+        if i in (first, last):
+            continue
+        while not turns[first] < turns[i] < turns[last]:
+            boards[i] = rng.sample(numbers, 25)
+            turns[i] = bingo_win_turn(boards[i], order)
+
+    yield ','.join(str(number) for number in numbers) + '\n'
+    for board in boards:
+        yield '\n'
+        for i in range(5):
+            yield ' '.join(f'{number:>2}' for number in board[5*i:5*i+5])
+            yield '\n'
+
+
+def generate_day05(rng: random.Random, scale: int) -> Iterator[str]:
+    extent = grid_side(1000, scale)
+    for _ in range(500 * scale):
+        length = rng.randint(1, min(extent, 1000) - 1)
+        x_step, y_step = rng.choice((
+            (1, 0), (0, 1), (1, 1), (1, -1),
+        ))
+        x1 = rng.randrange(extent - length * x_step)
+        y1 = rng.randrange(
+            length if y_step < 0 else 0, extent - max(y_step, 0) * length
+        )
+        x2, y2 = x1 + length * x_step, y1 + length * y_step
+        if rng.random() < 0.5:
+            x1, y1, x2, y2 = x2, y2, x1, y1
+        yield f'{x1},{y1} -> {x2},{y2}\n'
+
+
+def generate_day06(rng: random.Random, scale: int) -> Iterator[str]:
+    yield ','.join(str(rng.randint(1, 5)) for _ in range(300 * scale))
+    yield '\n'
+
+
+def generate_day07(rng: random.Random, scale: int) -> Iterator[str]:
+    crabs = 1000 * scale
+    yield ','.join(
+        str(int(rng.triangular(0, 2 * crabs, crabs / 4)))
+        for _ in range(crabs)
+    )
+    yield '\n'
+
+
+def generate_day08(rng: random.Random, scale: int) -> Iterator[str]:
+    for _ in range(200 * scale):
+        wiring = dict(zip('abcdefg', rng.sample('abcdefg', 7)))
+
+        def scramble(digit: int) -> str:
+            segments = [wiring[s] for s in SEVEN_SEGMENT_DIGITS[digit]]
+            rng.shuffle(segments)
+            return ''.join(segments)
+
+        patterns = [scramble(digit) for digit in rng.sample(range(10), 10)]
+        output = [scramble(rng.randrange(10)) for _ in range(4)]
+        yield ' '.join(patterns) + ' | ' + ' '.join(output) + '\n'
+
+
+def generate_day09(rng: random.Random, scale: int) -> Iterator[str]:
+    yield from digit_grid(rng, grid_side(100, scale), string.digits)
+
+
+def chunk_line(rng: random.Random, corrupted: bool) -> str:
+    stack: list[str] = []
+    chars = []
+    for _ in range(rng.randint(90, 110)):
+        if stack and rng.random() < 0.45:
+            chars.append(CLOSING_MATCH[stack.pop()])
+        else:
+            opening = rng.choice('([{<')
+            stack.append(opening)
+            chars.append(opening)
+    if corrupted:
+        expected = CLOSING_MATCH[stack[-1]] if stack else ''
+        chars.append(rng.choice([c for c in ')]}>' if c != expected]))
+    return ''.join(chars)
+
+
+def generate_day10(rng: random.Random, scale: int) -> Iterator[str]:
+    # The first line is incomplete so that part 2 always has a median.
+    yield chunk_line(rng, corrupted=False) + '\n'
+    for _ in range(90 * scale - 1):
+        yield chunk_line(rng, corrupted=rng.random() < 0.5) + '\n'
+
+
+def generate_day11(rng: random.Random, scale: int) -> Iterator[str]:
+    # Uniform digits almost never synchronise on big grids, which would
+    # leave part 2 spinning forever; energies of 4 and up flash in waves
+    # that sweep the whole grid within a few dozen steps.
+    yield from digit_grid(rng, grid_side(10, scale), '456789')
+
+
+def generate_day12(rng: random.Random, scale: int) -> Iterator[str]:
+    # The number of paths grows exponentially with the cave system, so the
+    # graph keeps the size of the bundled input whatever the scale.
+    small_caves = ['start', 'end'] + [
+        ''.join(pair) for pair in rng.sample(
+            list(product(string.ascii_lowercase, repeat=2)), 6
+        )
+    ]
+    big_caves = [
+        ''.join(pair) for pair in rng.sample(
+            list(product(string.ascii_uppercase, repeat=2)), 4
+        )
+    ]
+    # Big caves are never adjacent, otherwise there are infinitely many paths.
+    candidates = [
+        (v1, v2)
+        for i, v1 in enumerate(small_caves)
+        for v2 in small_caves[i + 1:] + big_caves
+        if (v1, v2) != ('start', 'end')
+    ]
+    for v1, v2 in rng.sample(candidates, 22):
+        yield f'{v1}-{v2}\n' if rng.random() < 0.5 else f'{v2}-{v1}\n'
+
+
+def generate_day13(rng: random.Random, scale: int) -> Iterator[str]:
+    extra_folds = round(math.log(scale, 4))
+    axes = ['x', 'y'] * (5 + extra_folds) + ['y', 'y']
+    width, height = 40, 6
+    folds = []
+    for axis in reversed(axes):
+        if axis == 'x':
+            folds.append(('x', width))
+            width = 2 * width + 1
+        else:
+            folds.append(('y', height))
+            height = 2 * height + 1
+    folds.reverse()
+
+    # Points are placed on the folded sheet and then unfolded, so none of
+    # them can land on a fold line.  The far corners pin the sheet to its
+    # full size.
+    points = {(width - 1, 0), (0, height - 1)}
+    while len(points) < 800 * scale:
+        x, y = rng.randrange(40), rng.randrange(6)
+        for axis, where in reversed(folds):
+            if rng.random() < 0.5:
+                continue
+            if axis == 'x':
+                x = 2 * where - x
+            else:
+                y = 2 * where - y
+        points.add((x, y))
+
+    for x, y in points:
+        yield f'{x},{y}\n'
+    yield '\n'
+    for axis, where in folds:
+        yield f'fold along {axis}={where}\n'
+
+
+def generate_day14(rng: random.Random, scale: int) -> Iterator[str]:
+    elements = rng.sample(string.ascii_uppercase, 10)
+    yield ''.join(rng.choices(elements, k=20 * scale)) + '\n'
+    yield '\n'
+    pairs = list(product(elements, repeat=2))
+    rng.shuffle(pairs)
+    for left, right in pairs:
+        yield f'{left}{right} -> {rng.choice(elements)}\n'
+
+
+def generate_day15(rng: random.Random, scale: int) -> Iterator[str]:
+    yield from digit_grid(rng, grid_side(100, scale), '123456789')
+
+
+def literal_bits(rng: random.Random, version: int) -> str:
+    value = rng.randrange(1 << rng.choice((4, 8, 12)))
+    nibbles = f'{value:b}'
+    nibbles = nibbles.zfill(-(-len(nibbles) // 4) * 4)
+    groups = [nibbles[i:i+4] for i in range(0, len(nibbles), 4)]
+    return f'{version:03b}100' + ''.join(
+        ('0' if i == len(groups) - 1 else '1') + group
+        for i, group in enumerate(groups)
+    )
+
+
+def packet_bits(rng: random.Random, packets: int, depth: int = 0) -> str:
+    version = rng.randrange(8)
+    if packets < 3 or depth >= 12:
+        return literal_bits(rng, version)
+
+    type_id = rng.choice((0, 1, 2, 3, 5, 6, 7))
+    operands = 2 if type_id >= 5 else rng.randint(1, min(8, packets - 1))
+    cuts = sorted(rng.sample(range(1, packets - 1), operands - 1))
+    budgets = [b - a for a, b in zip([0] + cuts, cuts + [packets - 1])]
+    subpackets = ''.join(
+        packet_bits(rng, budget, depth + 1) for budget in budgets
+    )
+    if len(subpackets) < 2 ** 15 and rng.random() < 0.5:
+        header = f'0{len(subpackets):015b}'
+    else:
+        header = f'1{operands:011b}'
+    return f'{version:03b}{type_id:03b}{header}{subpackets}'
+
+
+def generate_day16(rng: random.Random, scale: int) -> Iterator[str]:
+    bits = packet_bits(rng, 300 * scale)
+    bits += '0' * (-len(bits) % 8)
+    yield f'{int(bits, base=2):0{len(bits) // 4}X}\n'
+
+
+def generate_day17(rng: random.Random, scale: int) -> Iterator[str]:
+    # Every velocity up to the right edge and the depth is tried, each for
+    # as many steps as the depth, so the extents grow as scale ** (1 / 3).
+    stretch = sized(100, scale, 3) / 100
+    v_x = round(rng.randint(22, 25) * math.sqrt(stretch))
+    drift = v_x * (v_x + 1) // 2
+    left = drift - rng.randint(0, round(10 * stretch))
+    right = drift + rng.randint(round(10 * stretch), round(40 * stretch))
+    bottom = -rng.randint(round(90 * stretch), round(110 * stretch))
+    top = bottom + rng.randint(round(20 * stretch), round(40 * stretch))
+    yield f'target area: x={left}..{right}, y={bottom}..{top}\n'
+
+
+def snailfish_number(rng: random.Random, depth: int = 0) -> str:
+    def element() -> str:
+        if depth < 3 and rng.random() < 0.7:
+            return snailfish_number(rng, depth + 1)
+        return str(rng.randrange(10))
+
+    return f'[{element()},{element()}]'
+
+
+def generate_day18(rng: random.Random, scale: int) -> Iterator[str]:
+    # Part 2 adds up every pair of numbers.
+    for _ in range(sized(100, scale, 2)):
+        yield snailfish_number(rng) + '\n'
+
+
+def random_point(rng: random.Random, low: Vector, high: Vector) -> Vector:
+    x, y, z = (rng.randint(lo, hi) for lo, hi in zip(low, high))
+    return x, y, z
+
+
+def rotations() -> list[tuple[tuple[int, ...], tuple[int, ...]]]:
+    # Signed permutations of the axes with determinant 1.
+    return [
+        (axes, signs)
+        for axes in permutations(range(3))
+        for signs in product((1, -1), repeat=3)
+        if (
+            signs[0] * signs[1] * signs[2]
+            * (1 if axes in ((0, 1, 2), (1, 2, 0), (2, 0, 1)) else -1)
+        ) == 1
+    ]
+
+
+def bucket(point: Vector, size: int) -> Vector:
+    x, y, z = point
+    return x // size, y // size, z // size
+
+
+def nearby(
+    buckets: dict[Vector, list[Vector]],
+    point: Vector,
+    size: int,
+) -> Iterator[Vector]:
+    x, y, z = bucket(point, size)
+    for dx, dy, dz in product((-1, 0, 1), repeat=3):
+        yield from buckets.get((x + dx, y + dy, z + dz), [])
+
+
+def generate_day19(rng: random.Random, scale: int) -> Iterator[str]:
+    # Scanners are kept at least 1200 apart so that each one sees a few
+    # dozen beacons, like the bundled input, and every scanner shares a
+    # dozen beacons with the scanner it was placed next to. Scanners are
+    # matched against each other, so their number grows as sqrt(scale).
+    scanners = [(0, 0, 0)]
+    scanner_buckets = {(0, 0, 0): [(0, 0, 0)]}
+    beacons: set[Vector] = set()
+    while len(scanners) < sized(27, scale, 2):
+        parent = rng.choice(scanners)
+        offset = [rng.randint(-600, 600) for _ in range(3)]
+        offset[rng.randrange(3)] = rng.choice((-1, 1)) * rng.randint(
+            1200, 1400
+        )
+        x, y, z = (p + o for p, o in zip(parent, offset))
+        scanner = (x, y, z)
+        if any(
+            max(abs(s - o) for s, o in zip(scanner, other)) < 1200
+            for other in nearby(scanner_buckets, scanner, 1200)
+        ):
+            continue
+        low = (
+            max(parent[0], x) - 1000,
+            max(parent[1], y) - 1000,
+            max(parent[2], z) - 1000,
+        )
+        high = (
+            min(parent[0], x) + 1000,
+            min(parent[1], y) + 1000,
+            min(parent[2], z) + 1000,
+        )
+        beacons.update(random_point(rng, low, high) for _ in range(12))
+        scanners.append(scanner)
+        scanner_buckets.setdefault(bucket(scanner, 1200), []).append(scanner)
+    for x, y, z in scanners:
+        low = (x - 1000, y - 1000, z - 1000)
+        high = (x + 1000, y + 1000, z + 1000)
+        beacons.update(random_point(rng, low, high) for _ in range(6))
+
+    beacon_buckets: dict[Vector, list[Vector]] = {}
+    for beacon in beacons:
+        beacon_buckets.setdefault(bucket(beacon, 2000), []).append(beacon)
+
+    all_rotations = rotations()
+    for number, scanner in enumerate(scanners):
+        x, y, z = scanner
+        visible = [
+            tuple(b - s for b, s in zip(beacon, scanner))
+            for beacon in nearby(beacon_buckets, scanner, 2000)
+            if all(abs(b - s) <= 1000 for b, s in zip(beacon, scanner))
+        ]
+        rng.shuffle(visible)
+        axes, signs = rng.choice(all_rotations)
+        if number:
+            yield '\n'
+        yield f'--- scanner {number} ---\n'
+        for relative in visible:
+            yield ','.join(
+                str(sign * relative[axis]) for axis, sign in zip(axes, signs)
+            ) + '\n'
+
+
+def generate_day20(rng: random.Random, scale: int) -> Iterator[str]:
+    # A lit background must go dark again on the next step.
+    algorithm = ['#'] + rng.choices('#.', k=510) + ['.']
+    yield ''.join(algorithm) + '\n'
+    yield '\n'
+    yield from digit_grid(rng, grid_side(100, scale), '#.')
+
+
+def generate_day21(rng: random.Random, scale: int) -> Iterator[str]:
+    yield f'Player 1 starting position: {rng.randint(1, 10)}\n'
+    yield f'Player 2 starting position: {rng.randint(1, 10)}\n'
+
+
+def cuboid_instruction(rng: random.Random, extent: int, size: int) -> str:
+    ranges = []
+    for axis in 'xyz':
+        start = rng.randint(-extent, extent - size)
+        ranges.append(f'{axis}={start}..{start + rng.randint(1, size)}')
+    turn = 'on' if rng.random() < 0.6 else 'off'
+    return f'{turn} ' + ','.join(ranges) + '\n'
+
+
+def generate_day22(rng: random.Random, scale: int) -> Iterator[str]:
+    for _ in range(20):
+        yield cuboid_instruction(rng, 50, 50)
+    # Each instruction is split against the cuboids left by all before it.
+    for _ in range(sized(400, scale, 3)):
+        yield cuboid_instruction(rng, 100000, 30000)
+
+
+GENERATORS: dict[str, Generator] = {
+    'day00': generate_day00,
+    'day01': generate_day01,
+    'day02': generate_day02,
+    'day03': generate_day03,
+    'day04': generate_day04,
+    'day05': generate_day05,
+    'day06': generate_day06,
+    'day07': generate_day07,
+    'day08': generate_day08,
+    'day09': generate_day09,
+    'day10': generate_day10,
+    'day11': generate_day11,
+    'day12': generate_day12,
+    'day13': generate_day13,
+    'day14': generate_day14,
+    'day15': generate_day15,
+    'day16': generate_day16,
+    'day17': generate_day17,
+    'day18': generate_day18,
+    'day19': generate_day19,
+    'day20': generate_day20,
+    'day21': generate_day21,
+    'day22': generate_day22,
+}
+
+
+def generate_lines(day: str, scale: int, seed: int = 0) -> Iterator[str]:
+    return GENERATORS[day](random.Random(seed), scale)
+
+
+def generate_input(day: str, scale: int, seed: int = 0) -> str:
+    return ''.join(generate_lines(day, scale, seed))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description='Write a synthetic puzzle input to stdout.'
+    )
+    parser.add_argument('day', choices=sorted(GENERATORS))
+    parser.add_argument('--scale', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    sys.stdout.writelines(generate_lines(args.day, args.scale, args.seed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+import argparse
+from dataclasses import asdict, dataclass
+import json
+import statistics
+import sys
+import time
+from typing import Callable, Iterable, Iterator, TypeVar
+
+from aoc.main import DAYS, day_name, load_solution
+
+from . import generators
+
+SCALES = (1, 10, 100)
+# Days whose solvers take minutes beyond these scales; bigger ones are
+# skipped.
+MAX_SCALES = {'day15': 1, 'day17': 10, 'day18': 1, 'day19': 1, 'day22': 10}
+PHASES = ('parse', 'part_1', 'part_2')
+REPEAT = 5
+
+A = TypeVar('A')
+
+
+@dataclass(frozen=True)
+class Timing:
+    """Repeated samples, in seconds, of each phase of one day."""
+    day: str
+    scale: int
+    parse: list[float]
+    part_1: list[float]
+    part_2: list[float]
+
+
+@dataclass(frozen=True)
+class Summary:
+    median: float
+    lower_quartile: float
+    upper_quartile: float
+
+    @property
+    def iqr(self) -> float:
+        return self.upper_quartile - self.lower_quartile
+
+
+@dataclass(frozen=True)
+class Regression:
+    day: str
+    scale: int
+    phase: str
+    baseline: float
+    current: float
+
+
+def benchmark_input(day: str, scale: int, seed: int = 0) -> str:
+    # Generated even at 1x, so that every scale times the same kind of input.
+    return generators.generate_input(day, scale, seed)
+
+
+def timed(func: Callable[[], A]) -> tuple[A, float]:
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def time_phases(
+    day: str,
+    raw_input: str,
+    scale: int,
+    repeat: int = 1,
+) -> Timing:
+    solution = load_solution(day)
+    samples: dict[str, list[float]] = {phase: [] for phase in PHASES}
+    for _ in range(repeat):
+        puzzle_input, parse_time = timed(
+            lambda: solution.parse_input(raw_input)
+        )
+        _, part_1_time = timed(lambda: solution.part_1(puzzle_input))
+        _, part_2_time = timed(lambda: solution.part_2(puzzle_input))
+        samples['parse'].append(parse_time)
+        samples['part_1'].append(part_1_time)
+        samples['part_2'].append(part_2_time)
+    return Timing(day, scale, **samples)
+
+
+def run(
+    days: Iterable[str],
+    scales: Iterable[int],
+    seed: int = 0,
+    repeat: int = 1,
+) -> Iterator[Timing]:
+    for day in days:
+        for scale in scales:
+            if scale > MAX_SCALES.get(day, scale):
+                continue
+            raw_input = benchmark_input(day, scale, seed)
+            yield time_phases(day, raw_input, scale, repeat)
+
+
+def summarize(samples: list[float]) -> Summary:
+    if len(samples) < 2:
+        return Summary(samples[0], samples[0], samples[0])
+    lower, median, upper = statistics.quantiles(samples, n=4)
+    return Summary(median, lower, upper)
+
+
+def save_baseline(path: str, timings: Iterable[Timing]) -> None:
+    with open(path, 'w') as f:
+        json.dump([asdict(timing) for timing in timings], f, indent=2)
+
+
+def load_baseline(path: str) -> list[Timing]:
+    with open(path, 'r') as f:
+        return [Timing(**raw_timing) for raw_timing in json.load(f)]
+
+
+def compare(
+    baseline: Iterable[Timing],
+    current: Iterable[Timing],
+    tolerance: float = 0.2,
+    min_seconds: float = 1e-3,
+) -> list[Regression]:
+    """Phases whose median got slower by more than tolerance.
+
+    Noise is ruled out by also requiring the interquartile ranges of the
+    two runs not to overlap, and by ignoring differences below
+    min_seconds.
+    """
+    baseline_timings = {
+        (timing.day, timing.scale): timing for timing in baseline
+    }
+    regressions = []
+    for timing in current:
+        try:
+            baseline_timing = baseline_timings[timing.day, timing.scale]
+        except KeyError:
+            continue
+        for phase in PHASES:
+            before = summarize(getattr(baseline_timing, phase))
+            after = summarize(getattr(timing, phase))
+            slower = after.median > before.median * (1 + tolerance)
+            significant = (
+                after.median - before.median > min_seconds
+                and after.lower_quartile > before.upper_quartile
+            )
+            if slower and significant:
+                regressions.append(Regression(
+                    timing.day, timing.scale, phase,
+                    before.median, after.median,
+                ))
+    return regressions
+
+
+def format_timing(timing: Timing) -> str:
+    summaries = (
+        (phase, summarize(getattr(timing, phase))) for phase in PHASES
+    )
+    return f'{timing.day} {timing.scale:>4}x ' + ' '.join(
+        f'{phase} {summary.median:10.6f}s \u00b1{summary.iqr:.6f}'
+        for phase, summary in summaries
+    )
+
+
+def format_regression(regression: Regression) -> str:
+    return (
+        f'REGRESSION {regression.day} {regression.scale}x {regression.phase}:'
+        f' median {regression.baseline:.6f}s -> {regression.current:.6f}s'
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description='Time the parse, part 1 and part 2 phases of each day.'
+    )
+    parser.add_argument('days', nargs='*', type=day_name, default=DAYS)
+    parser.add_argument(
+        '--scales', nargs='+', type=int, default=SCALES,
+        help="input sizes to time, skipping those over a day's maximum",
+    )
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument(
+        '--repeat', type=int, default=REPEAT,
+        help='samples to take of each phase',
+    )
+    parser.add_argument('--save', help='write the timings to this JSON file')
+    parser.add_argument('--baseline', help='compare against this JSON file')
+    parser.add_argument('--tolerance', type=float, default=0.2)
+    args = parser.parse_args()
+
+    timings = []
+    for timing in run(args.days, args.scales, args.seed, args.repeat):
+        print(format_timing(timing))
+        timings.append(timing)
+
+    if args.save:
+        save_baseline(args.save, timings)
+
+    if args.baseline:
+        regressions = compare(
+            load_baseline(args.baseline), timings, args.tolerance
+        )
+        for regression in regressions:
+            print(format_regression(regression), file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
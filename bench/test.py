@@ -0,0 +1,104 @@
+import os
+
+import pytest
+
+from . import generators, main
+
+
+def test_benchmark_input_is_generated() -> None:
+    assert main.benchmark_input('day05', 1) == (
+        generators.generate_input('day05', 1)
+    )
+
+
+def test_run_skips_scales_over_maximum() -> None:
+    timings = main.run(['day15', 'day00'], [10], repeat=1)
+    assert [(timing.day, timing.scale) for timing in timings] == [
+        ('day00', 10)
+    ]
+
+
+@pytest.mark.parametrize('day', main.DAYS)
+def test_generated_input_parses(day: str) -> None:
+    solution = main.load_solution(day)
+    solution.parse_input(generators.generate_input(day, 1))
+
+
+# Days that take seconds on generated input only run with -m slow.
+SLOW_DAYS = ('day15', 'day17', 'day18', 'day19')
+
+
+@pytest.mark.parametrize('day', [
+    pytest.param(day, marks=pytest.mark.slow) if day in SLOW_DAYS else day
+    for day in main.DAYS
+])
+def test_generated_input_solves(day: str) -> None:
+    solution = main.load_solution(day)
+    puzzle_input = solution.parse_input(generators.generate_input(day, 1))
+    solution.part_1(puzzle_input)
+    solution.part_2(puzzle_input)
+
+
+def test_generators_are_seeded() -> None:
+    assert (
+        generators.generate_input('day05', 1, seed=1)
+        == generators.generate_input('day05', 1, seed=1)
+        != generators.generate_input('day05', 1, seed=2)
+    )
+
+
+def test_time_phases() -> None:
+    timing = main.time_phases('day00', main.benchmark_input('day00', 1), 1, 3)
+    assert timing.day == 'day00'
+    for phase in main.PHASES:
+        samples = getattr(timing, phase)
+        assert len(samples) == 3
+        assert all(sample >= 0 for sample in samples)
+
+
+def test_summarize() -> None:
+    summary = main.summarize([0.4, 0.1, 0.3, 0.2, 0.5])
+    assert summary.median == 0.3
+    assert summary.lower_quartile < summary.median < summary.upper_quartile
+    assert main.summarize([0.1]).iqr == 0
+
+
+def test_compare() -> None:
+    baseline = [main.Timing('day01', 1, [0.1] * 3, [0.1] * 3, [0.1] * 3)]
+    current = [main.Timing('day01', 1, [0.1] * 3, [0.5] * 3, [0.11] * 3)]
+    assert main.compare(baseline, current) == [
+        main.Regression('day01', 1, 'part_1', 0.1, 0.5)
+    ]
+
+
+def test_compare_ignores_noise() -> None:
+    baseline = [main.Timing(
+        'day01', 1, [0.1] * 5, [0.1] * 5, [0.06, 0.08, 0.1, 0.12, 0.2]
+    )]
+    current = [main.Timing(
+        'day01', 1, [0.1] * 5, [0.1] * 5, [0.1, 0.11, 0.13, 0.15, 0.19]
+    )]
+    assert main.compare(baseline, current) == []
+
+
+@pytest.mark.bench
+@pytest.mark.parametrize('day', main.DAYS)
+def test_no_regression(day: str) -> None:
+    baseline_path = os.environ.get('BENCH_BASELINE')
+    if baseline_path is None:
+        pytest.skip('set BENCH_BASELINE to a file saved by --save')
+    baseline = [
+        timing for timing in main.load_baseline(baseline_path)
+        if timing.day == day
+    ]
+    current = [
+        main.time_phases(
+            day,
+            main.benchmark_input(day, timing.scale),
+            timing.scale,
+            len(timing.parse),
+        )
+        for timing in baseline
+    ]
+    regressions = main.compare(baseline, current)
+    assert not regressions, '\n'.join(map(main.format_regression, regressions))
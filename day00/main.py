@@ -3,13 +3,36 @@ import os.path
 SCRIPT_DIR = os.path.dirname(os.path.relpath(__file__))
 
 
+def parse_input(raw_input: str) -> tuple[str, str]:
+    answer_1, answer_2 = raw_input.splitlines(keepends=True)
+    return answer_1, answer_2
+
+
+def part_1(answers: tuple[str, str]) -> str:
+    answer_1, _ = answers
+    return answer_1
+
+
+def part_2(answers: tuple[str, str]) -> str:
+    _, answer_2 = answers
+    return answer_2
+
+
+def solve(raw_input: str) -> tuple[str, str]:
+    puzzle_input = parse_input(raw_input)
+    return part_1(puzzle_input), part_2(puzzle_input)
+
+
 def main() -> None:
     with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
-        answer_1, answer_2 = f.readlines()
+        raw_input = f.read()
+    answers = parse_input(raw_input)
 
+    answer_1 = part_1(answers)
     assert answer_1 == 'hello\n'
     print(answer_1)
 
+    answer_2 = part_2(answers)
     assert answer_2 == 'there\n'
     print(answer_2)
 
@@ -1,37 +1,125 @@
-from itertools import islice, tee
-from typing import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 import os.path
+from typing import Iterable, Iterator
+
+import numpy as np
+import numpy.typing as np_typing
+
+from aoc.loader import Buffer, mapped
+from aoc.parsing import parse_ints
 
 SCRIPT_DIR = os.path.dirname(os.path.relpath(__file__))
+CHUNK_BYTES = 64 * 1024 * 1024
+
+Depths = np_typing.NDArray[np.int64]
+
+
+def parse_depths(raw_depths: str) -> Depths:
+    return parse_ints(raw_depths, '\n')
+
+
+def count_increases(depths: Depths, window: int = 1) -> int:
+    """Count how often the sum of a sliding window goes up."""
+    if window < 1:
+        raise ValueError(f'window must be positive, got {window}')
+    # Windows share all but their ends, so compare readings window apart.
+    return int(np.count_nonzero(depths[window:] > depths[:-window]))
+
+
+def chunk_bounds(
+    buffer: Buffer,
+    chunk_bytes: int,
+) -> Iterator[tuple[int, int]]:
+    """Split the buffer into runs of about chunk_bytes of whole lines."""
+    start = 0
+    while start < len(buffer):
+        end = buffer.find(b'\n', start + chunk_bytes - 1) + 1
+        if end == 0:
+            end = len(buffer)
+        yield start, end
+        start = end
+
 
+def count_chunk(
+    path: str,
+    bounds: tuple[int, int],
+    window: int,
+) -> tuple[int, Depths, Depths]:
+    """Count increases in one chunk, plus its first and last readings."""
+    start, end = bounds
+    with mapped(path) as buffer:
+        depths = parse_depths(buffer[start:end].decode())
+    return count_increases(depths, window), depths[:window], depths[-window:]
 
-def diffs(xs: Iterable[int]) -> Iterator[int]:
-    lefts, rights = tee(xs)
-    yield from (
-        right - left
-        for left, right in zip(lefts, islice(rights, 1, None))
-    )
 
+def count_chunks(
+    path: str,
+    bounds: Iterable[tuple[int, int]],
+    window: int,
+    jobs: int = 1,
+) -> Iterator[tuple[int, Depths, Depths]]:
+    count = partial(count_chunk, path, window=window)
+    if jobs == 1:
+        yield from map(count, bounds)
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        yield from executor.map(count, bounds)
 
-def triads(xs: Iterable[int]) -> Iterator[int]:
-    lefts, middles, rights = tee(xs, 3)
-    yield from (
-        left + middle + right
-        for left, middle, right in zip(
-            lefts, islice(middles, 1, None), islice(rights, 2, None)
+
+def count_increases_in_file(
+    path: str,
+    window: int = 1,
+    chunk_bytes: int = CHUNK_BYTES,
+    jobs: int = 1,
+) -> int:
+    """count_increases() over a file of any size, a chunk at a time."""
+    with mapped(path) as buffer:
+        bounds = list(chunk_bounds(buffer, chunk_bytes))
+
+    increases = 0
+    carry = np.empty(0, dtype=np.int64)
+    for chunk_increases, head, tail in count_chunks(
+        path, bounds, window, jobs
+    ):
+        # With at most window readings on each side of the seam, every
+        # pair window apart has one reading on each side.
+        increases += chunk_increases + count_increases(
+            np.concatenate([carry, head]), window
         )
-    )
+        carry = np.concatenate([carry, tail])[-window:]
+    return increases
+
+
+def parse_lines(raw_lines: Iterable[str]) -> Depths:
+    return np.fromiter((int(line) for line in raw_lines), dtype=np.int64)
+
+
+def parse_input(raw_input: str) -> Depths:
+    return parse_depths(raw_input)
+
+
+def part_1(depths: Depths) -> int:
+    return count_increases(depths, 1)
+
+
+def part_2(depths: Depths) -> int:
+    return count_increases(depths, 3)
+
+
+def solve(raw_input: str) -> tuple[int, int]:
+    puzzle_input = parse_input(raw_input)
+    return part_1(puzzle_input), part_2(puzzle_input)
 
 
 def main() -> None:
-    with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
-        depths = [int(line) for line in f.readlines()]
+    path = f'{SCRIPT_DIR}/input.txt'
 
-    answer_1 = sum(1 for diff in diffs(depths) if diff > 0)
+    answer_1 = count_increases_in_file(path, 1)
     assert answer_1 == 1390
     print(answer_1)
 
-    answer_2 = sum(1 for diff in diffs(triads(depths)) if diff > 0)
+    answer_2 = count_increases_in_file(path, 3)
     print(answer_2)
 
 
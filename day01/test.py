@@ -1,5 +1,30 @@
+import os
+
 from . import main
 
 
 def test_main() -> None:
     main.main()
+
+
+def test_count_increases() -> None:
+    depths = main.parse_input(
+        '199\n200\n208\n210\n200\n207\n240\n269\n260\n263\n'
+    )
+    assert main.count_increases(depths, 1) == 7
+    assert main.count_increases(depths, 3) == 5
+    assert main.count_increases(depths, 10) == 0
+
+
+def test_count_increases_in_file(tmp_path: str) -> None:
+    raw_depths = '199\n200\n208\n210\n200\n207\n240\n269\n260\n263\n'
+    path = os.path.join(tmp_path, 'input.txt')
+    with open(path, 'w') as f:
+        f.write(raw_depths)
+    depths = main.parse_input(raw_depths)
+    for window in (1, 3, 4):
+        expected = main.count_increases(depths, window)
+        for chunk_bytes, jobs in ((1, 1), (5, 1), (9, 2), (100, 1)):
+            assert main.count_increases_in_file(
+                path, window, chunk_bytes, jobs
+            ) == expected
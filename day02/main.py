@@ -1,61 +1,177 @@
 from dataclasses import dataclass
-from enum import Enum
+from functools import cached_property
 import os.path
 
+import numpy as np
+import numpy.typing as np_typing
+
+from aoc.loader import Buffer, mapped
+
 SCRIPT_DIR = os.path.dirname(os.path.relpath(__file__))
 
+WORDS = (b'forward', b'down', b'up')
+# Moves are told apart by their first letter once the words are checked.
+FORWARD, DOWN, UP = (word[0] for word in WORDS)
+
+NEWLINE = ord('\n')
+SPACE = ord(' ')
+ZERO = ord('0')
+# Distances must fit an int64; sums and products of them are widened to
+# Python ints whenever they might not.
+MAX_DIGITS = 18
+INT64_MAX = np.iinfo(np.int64).max
+
+# Moves as int64, or as Python ints once their totals could overflow.
+Column = np_typing.NDArray[np.int64 | np.object_]
+
+
+def largest_magnitude(values: Column) -> int:
+    return int(np.abs(values).max(initial=0))
+
 
-class Direction(Enum):
-    UP = 'up'
-    DOWN = 'down'
-    FORWARD = 'forward'
+def total(values: Column) -> int:
+    if len(values) * largest_magnitude(values) > INT64_MAX:
+        return sum(values.tolist())
+    return int(np.sum(values))
 
 
 @dataclass(frozen=True)
-class Move:
-    direction: Direction
-    distance: int
+class State:
+    horiz: int
+    depth: int
+    aim: int
+
+
+class Trajectory:
+    """Every intermediate part 2 state, from prefix sums over the course."""
+
+    def __init__(self, horizontal: Column, vertical: Column):
+        # Depth adds up to len products of a distance and an aim, and an
+        # aim adds up to len distances.
+        largest = max(
+            largest_magnitude(horizontal), largest_magnitude(vertical)
+        )
+        if (len(horizontal) * largest) ** 2 > INT64_MAX:
+            horizontal = horizontal.astype(object)
+            vertical = vertical.astype(object)
+        self.horiz = np.cumsum(horizontal)
+        self.aim = np.cumsum(vertical)
+        self.depth = np.cumsum(np.multiply(horizontal, self.aim))
+        # Non-decreasing, so it can be binary searched.
+        self._deepest = np.maximum.accumulate(self.depth)
+
+    def __len__(self) -> int:
+        return len(self.horiz)
+
+    def state(self, step: int) -> State:
+        """The state after the first step moves."""
+        if not 0 <= step <= len(self):
+            raise IndexError(f'step {step} is not in 0..{len(self)}')
+        if step == 0:
+            return State(0, 0, 0)
+        return State(
+            int(self.horiz[step - 1]),
+            int(self.depth[step - 1]),
+            int(self.aim[step - 1]),
+        )
+
+    def first_deeper_than(self, depth: int) -> int | None:
+        """The first step after which the depth exceeds depth, if any."""
+        if depth < 0:
+            return 0
+        index = int(np.searchsorted(self._deepest, depth, side='right'))
+        return index + 1 if index < len(self) else None
+
+
+@dataclass(frozen=True)
+class Course:
+    directions: np_typing.NDArray[np.uint8]
+    distances: np_typing.NDArray[np.int64]
+
+    def vertical(self) -> np_typing.NDArray[np.int64]:
+        """Signed change of depth (part 1) or aim (part 2) per move."""
+        return np.select(
+            [self.directions == DOWN, self.directions == UP],
+            [self.distances, -self.distances],
+        )
+
+    def horizontal(self) -> np_typing.NDArray[np.int64]:
+        return np.where(self.directions == FORWARD, self.distances, 0)
+
+    @cached_property
+    def trajectory(self) -> Trajectory:
+        return Trajectory(self.horizontal(), self.vertical())
 
 
-def parse_move(raw_move: str) -> Move:
-    direction, distance = raw_move.split(maxsplit=1)
+def parse_course(buffer: Buffer) -> Course:
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    ends = np.flatnonzero(data == NEWLINE)
+    if len(data) and data[-1] != NEWLINE:
+        ends = np.append(ends, len(data))
+    starts = np.concatenate([np.zeros(1, dtype=np.int64), ends + 1])
+    starts = starts[:len(ends)]
 
-    direction = Direction(direction)
-    distance = int(distance)
+    spaces = np.flatnonzero(data == SPACE)
+    first_space = np.searchsorted(spaces, starts)
+    if np.any(np.searchsorted(spaces, ends) - first_space != 1):
+        raise ValueError('every move needs exactly one distance')
+    breaks = spaces[first_space]
 
-    return Move(direction, distance)
+    words = breaks - starts
+    known = np.zeros(len(starts), dtype=bool)
+    for word in WORDS:
+        matches = words == len(word)
+        for offset, letter in enumerate(word):
+            positions = np.minimum(starts + offset, breaks)
+            matches &= data[positions] == letter
+        known |= matches
+    if not known.all():
+        raise ValueError('moves must be forward, down or up')
+
+    digits = ends - breaks - 1
+    if np.any(digits < 1) or np.any(digits > MAX_DIGITS):
+        raise ValueError(f'distances must have 1 to {MAX_DIGITS} digits')
+    distances = np.zeros(len(starts), dtype=np.int64)
+    for place in range(int(digits.max(initial=0))):
+        has_place = digits > place
+        values = data[ends[has_place] - 1 - place].astype(np.int64) - ZERO
+        if np.any((values < 0) | (values > 9)):
+            raise ValueError('distances must be whole numbers')
+        distances[has_place] += values * 10 ** place
+    return Course(data[starts], distances)
+
+
+def parse_buffer(buffer: Buffer) -> Course:
+    return parse_course(buffer)
+
+
+def parse_input(raw_input: str) -> Course:
+    return parse_course(raw_input.encode())
+
+
+def part_1(course: Course) -> int:
+    return total(course.horizontal()) * total(course.vertical())
+
+
+def part_2(course: Course) -> int:
+    final = course.trajectory.state(len(course.trajectory))
+    return final.horiz * final.depth
+
+
+def solve(raw_input: str) -> tuple[int, int]:
+    puzzle_input = parse_input(raw_input)
+    return part_1(puzzle_input), part_2(puzzle_input)
 
 
 def main() -> None:
-    with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
-        moves = [parse_move(raw_move) for raw_move in f.readlines()]
-
-    horiz, depth = 0, 0
-    for move in moves:
-        match move:
-            case Move(Direction.FORWARD, distance):
-                horiz += distance
-            case Move(Direction.UP, distance):
-                depth -= distance
-            case Move(Direction.DOWN, distance):
-                depth += distance
-
-    answer_1 = horiz * depth
+    with mapped(f'{SCRIPT_DIR}/input.txt') as buffer:
+        course = parse_buffer(buffer)
+
+    answer_1 = part_1(course)
     assert answer_1 == 1690020
     print(answer_1)
 
-    horiz, depth, aim = 0, 0, 0
-    for move in moves:
-        match move:
-            case Move(Direction.FORWARD, distance):
-                horiz += distance
-                depth += distance * aim
-            case Move(Direction.UP, distance):
-                aim -= distance
-            case Move(Direction.DOWN, distance):
-                aim += distance
-
-    answer_2 = horiz * depth
+    answer_2 = part_2(course)
     assert answer_2 == 1408487760
     print(answer_2)
 
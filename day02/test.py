@@ -1,5 +1,71 @@
+import os
+
+import pytest
+
+from aoc.loader import mapped
+
 from . import main
 
 
 def test_main() -> None:
     main.main()
+
+
+def test_example() -> None:
+    course = main.parse_input(
+        'forward 5\ndown 5\nforward 8\nup 3\ndown 8\nforward 2\n'
+    )
+    assert main.part_1(course) == 150
+    assert main.part_2(course) == 900
+
+
+def test_trajectory() -> None:
+    trajectory = main.parse_input(
+        'forward 5\ndown 5\nforward 8\nup 3\ndown 8\nforward 2\n'
+    ).trajectory
+    assert trajectory.state(0) == main.State(0, 0, 0)
+    assert trajectory.state(3) == main.State(13, 40, 5)
+    assert trajectory.state(6) == main.State(15, 60, 10)
+    assert trajectory.first_deeper_than(-1) == 0
+    assert trajectory.first_deeper_than(0) == 3
+    assert trajectory.first_deeper_than(40) == 6
+    assert trajectory.first_deeper_than(60) is None
+
+
+def test_malformed_moves() -> None:
+    for raw_course in (
+        'forward 5 3\ndown\n',
+        'fly 5\n',
+        'forwards 5\n',
+        'up\n',
+        'up 5x\n',
+        'up -5\n',
+        'forward 5\n\ndown 3\n',
+    ):
+        with pytest.raises(ValueError):
+            main.parse_input(raw_course)
+
+
+def test_parse_without_trailing_newline() -> None:
+    course = main.parse_input('forward 12\nup 3')
+    assert course.distances.tolist() == [12, 3]
+    assert len(main.parse_input('').distances) == 0
+
+
+def test_malformed_mapped_file(tmp_path: str) -> None:
+    path = os.path.join(tmp_path, 'input.txt')
+    with open(path, 'w') as f:
+        f.write('forward 5\nfly 3\n')
+    with pytest.raises(ValueError):
+        with mapped(path) as buffer:
+            main.parse_buffer(buffer)
+
+
+def test_large_distances_are_exact() -> None:
+    course = main.parse_input('down 3000000000\nforward 4000000000\n')
+    assert main.part_1(course) == 12 * 10**18
+    assert main.part_2(course) == 4 * 10**9 * 12 * 10**18
+    course = main.parse_input(
+        'down 999999999999999999\nforward 999999999999999999\n' * 3
+    )
+    assert main.part_1(course) == (3 * (10**18 - 1)) ** 2
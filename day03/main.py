@@ -1,60 +1,110 @@
-from collections import Counter
-from operator import itemgetter
 import os.path
-from typing import Callable, Iterable, Tuple, TypeVar
+from typing import Callable
+
+import numpy as np
+import numpy.typing as np_typing
+
+from aoc.grid import Grid, parse_digits
+from aoc.loader import Buffer, mapped
 
 SCRIPT_DIR = os.path.dirname(os.path.relpath(__file__))
 
-A = TypeVar('A')
+# Picks the bit to keep from how many of the total readings have a 1.
+Criterion = Callable[[int, int], int]
 
 
-def _common(  # type: ignore[misc]
-    iterable: Iterable[A],
-    func: Callable[..., Tuple[A, int]],
-) -> A:
-    count = Counter(iterable)
-    return func(count.items(), key=itemgetter(1, 0))[0]
+def most_common(ones: int, total: int) -> int:
+    return int(2 * ones >= total)
 
 
-def most_common(iterable: Iterable[A]) -> A:
-    return _common(iterable, max)
+def least_common(ones: int, total: int) -> int:
+    if ones in (0, total):
+        return int(ones > 0)
+    return int(2 * ones < total)
 
 
-def least_common(iterable: Iterable[A]) -> A:
-    return _common(iterable, min)
+def bits_to_int(bits: Grid) -> int:
+    return int(''.join(map(str, bits.tolist())) or '0', base=2)
 
 
-def filter_lines(
-    lines: Iterable[str],
-    criterion: Callable[[Iterable[str]], str],
-) -> str:
-    i = 0
-    while True:
-        idx_criterion = criterion(line[i] for line in lines)
-        lines = [
-            line for line in lines
-            if line[i] == idx_criterion
-        ]
-        if len(lines) == 1:
-            return lines[0]
-        i += 1
+def reading_values(report: Grid) -> np_typing.NDArray[np.uint64 | np.object_]:
+    """Each reading as one number, uint64 where it fits."""
+    width = report.shape[1]
+    if width > 64:
+        return np.array([bits_to_int(row) for row in report], dtype=object)
+    packed = np.packbits(report, axis=1)
+    packed = np.pad(packed, ((0, 0), (0, 8 - packed.shape[1])))
+    return packed.view('>u8')[:, 0] >> np.uint64(64 - width)
 
 
-def main() -> None:
-    with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
-        lines = [line.strip() for line in f.readlines()]
+class RatingIndex:
+    """The readings sorted, so those sharing a prefix are contiguous."""
+
+    def __init__(self, report: Grid):
+        self.width = report.shape[1]
+        self._readings = np.sort(reading_values(report))
+
+    def rating(self, criterion: Criterion, width: int | None = None) -> int:
+        """Narrow down on the first width bits (default: all of them)."""
+        low, high = 0, len(self._readings)
+        prefix = 0
+        for i in range(self.width if width is None else width):
+            if high - low == 1:
+                break
+            bit = 1 << (self.width - 1 - i)
+            split = low + int(
+                np.searchsorted(self._readings[low:high], prefix | bit)
+            )
+            if criterion(high - split, high - low):
+                low, prefix = split, prefix | bit
+            else:
+                high = split
+        return int(self._readings[low])
+
+
+def parse_report(raw_report: Buffer | str) -> Grid:
+    report = parse_digits(raw_report)
+    if np.any(report > 1):
+        raise ValueError('readings must be binary')
+    return report
+
+
+def parse_buffer(buffer: Buffer) -> Grid:
+    return parse_report(buffer)
+
 
-    gamma = int(''.join(most_common(digit) for digit in zip(*lines)), base=2)
-    epsilon = 2 ** len(lines[0]) - 1 - gamma
+def parse_input(raw_input: str) -> Grid:
+    return parse_report(raw_input)
 
-    answer_1 = gamma * epsilon
+
+def part_1(report: Grid) -> int:
+    ones = np.count_nonzero(report, axis=0)
+    gamma = bits_to_int((2 * ones >= len(report)).astype(np.uint8))
+    epsilon = 2 ** report.shape[1] - 1 - gamma
+    return gamma * epsilon
+
+
+def part_2(report: Grid) -> int:
+    index = RatingIndex(report)
+    co2_rating = index.rating(most_common)
+    o2_rating = index.rating(least_common)
+    return co2_rating * o2_rating
+
+
+def solve(raw_input: str) -> tuple[int, int]:
+    puzzle_input = parse_input(raw_input)
+    return part_1(puzzle_input), part_2(puzzle_input)
+
+
+def main() -> None:
+    with mapped(f'{SCRIPT_DIR}/input.txt') as buffer:
+        report = parse_buffer(buffer)
+
+    answer_1 = part_1(report)
     assert answer_1 == 4006064
     print(answer_1)
 
-    co2_rating = int(filter_lines(lines, most_common), base=2)
-    o2_rating = int(filter_lines(lines, least_common), base=2)
-
-    answer_2 = co2_rating * o2_rating
+    answer_2 = part_2(report)
     assert answer_2 == 5941884
     print(answer_2)
 
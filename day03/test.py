@@ -3,3 +3,26 @@ from . import main
 
 def test_main() -> None:
     main.main()
+
+
+def test_example() -> None:
+    report = main.parse_input(
+        '00100\n11110\n10110\n10111\n10101\n01111\n'
+        '00111\n11100\n10000\n11001\n00010\n01010\n'
+    )
+    assert main.part_1(report) == 198
+    assert main.part_2(report) == 230
+
+
+def test_wide_readings() -> None:
+    report = main.parse_input('1' * 80 + '\n' + '1' + '0' * 79 + '\n')
+    assert main.part_1(report) == 0
+    assert main.part_2(report) == 2 ** 79 * (2 ** 80 - 1)
+
+
+def test_rating_width() -> None:
+    index = main.RatingIndex(main.parse_input('000\n011\n101\n110\n111\n'))
+    assert index.rating(main.most_common) == 0b111
+    assert index.rating(main.least_common) == 0b000
+    assert index.rating(main.most_common, width=1) == 0b101
+    assert index.rating(main.most_common, width=2) == 0b110
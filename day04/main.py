@@ -1,11 +1,21 @@
-from typing import cast, Sequence
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import cast, Iterable, Iterator, Sequence
 import os.path
 
+import numpy as np
+import numpy.typing as np_typing
+
+from aoc.loader import read_lines
+
 SCRIPT_DIR = os.path.dirname(os.path.relpath(__file__))
+BATCH_BOARDS = 10_000
 
 
 Row = tuple[int, int, int, int, int]
 Board = tuple[Row, Row, Row, Row, Row]
+# Any number of boards, shaped (boards, 5, 5).
+Boards = np_typing.NDArray[np.int64]
 
 
 class Game:
@@ -14,6 +24,9 @@ class Game:
         self._board = board
         self._flat_board = [entry for row in board for entry in row]
         self._marked = [False for _ in range(len(self._flat_board))]
+        self._row_hits = [0 for _ in range(5)]
+        self._col_hits = [0 for _ in range(5)]
+        self._won = False
 
     def __str__(self) -> str:
         to_print = [
@@ -31,13 +44,20 @@ class Game:
         except ValueError:
             pass
         else:
-            self._marked[idx] = True
+            self.mark_cell(idx)
+
+    def mark_cell(self, idx: int) -> None:
+        if self._marked[idx]:
+            return
+        self._marked[idx] = True
+        row, col = divmod(idx, 5)
+        self._row_hits[row] += 1
+        self._col_hits[col] += 1
+        if self._row_hits[row] == 5 or self._col_hits[col] == 5:
+            self._won = True
 
     def won(self) -> bool:
-        return (
-            any(all(self._marked[5*i:5*i+5]) for i in range(5))
-            or any(all(self._marked[i::5]) for i in range(5))
-        )
+        return self._won
 
     def sum_unmarked(self) -> int:
         return sum(
@@ -47,70 +67,164 @@ class Game:
 
     @classmethod
     def parse(cls, raw_board: str) -> 'Game':
-        raw_rows = [r.strip() for r in raw_board.split('\n', maxsplit=4)]
-        board = tuple(
-            tuple(int(raw_entry) for raw_entry in raw_row.split(maxsplit=4))
-            for raw_row in raw_rows
+        return cls(parse_board(raw_board))
+
+
+class Bingo:
+    """Games indexed by number, so a draw only visits the cells it marks."""
+
+    def __init__(self, boards: Sequence[Board]):
+        self.games = [Game(board) for board in boards]
+        self._cells: defaultdict[int, list[tuple[Game, int]]] = (
+            defaultdict(list)
         )
-        return cls(cast(Board, board))
+        for game, board in zip(self.games, boards):
+            for idx, number in enumerate(n for row in board for n in row):
+                self._cells[number].append((game, idx))
+
+    def draw(self, number: int) -> list[Game]:
+        """Mark number everywhere, returning the games it made win."""
+        newly_won = []
+        for game, idx in self._cells.get(number, ()):
+            if not game.won():
+                game.mark_cell(idx)
+                if game.won():
+                    newly_won.append(game)
+        return newly_won
+
+
+def parse_board(raw_board: str) -> Board:
+    raw_rows = [r.strip() for r in raw_board.split('\n', maxsplit=4)]
+    board = tuple(
+        tuple(int(raw_entry) for raw_entry in raw_row.split(maxsplit=4))
+        for raw_row in raw_rows
+    )
+    return cast(Board, board)
+
+
+def parse_boards(raw_boards: str) -> Boards:
+    return np.array(raw_boards.split(), dtype=np.int64).reshape(-1, 5, 5)
 
 
 def parse_numbers(raw_numbers: str) -> list[int]:
     return [int(raw_number) for raw_number in raw_numbers.split(',')]
 
 
-def simulate_winning(
-    games: Sequence[Game],
-    numbers: Sequence[int]
-) -> tuple[Game, int]:
-    winners = []
-    for number in numbers:
-        for game in games:
-            game.mark(number)
-            if game.won():
-                winners.append(game)
-        if winners:
-            break
-    assert len(winners) == 1
-    winner = winners[0]
-    return winner, number
-
-
-def simulate_losing(
-    games: Sequence[Game],
-    numbers: Sequence[int]
-) -> tuple[Game, int]:
-    for number in numbers:
-        newly_won: list[Game] = []
-        for game in games:
-            game.mark(number)
-            if game.won():
-                newly_won.append(game)
-        games = [game for game in games if game not in newly_won]
-        if not games:
-            break
-    assert len(newly_won) == 1
-    loser = newly_won[0]
-    return loser, number
+@dataclass(frozen=True)
+class Standings:
+    """Every board's result, with the board numbers in winning order."""
+    ranking: np_typing.NDArray[np.intp]
+    win_turns: np_typing.NDArray[np.int64]
+    scores: np_typing.NDArray[np.int64]
+
+
+def cell_turns(numbers: Sequence[int], boards: Boards) -> Boards:
+    """The turn each cell gets marked on, or len(numbers) if never."""
+    turn_of = np.full(
+        max(int(boards.max(initial=0)), max(numbers)) + 1, len(numbers)
+    )
+    # Assigned last to first, so repeated draws keep their first turn.
+    turn_of[np.asarray(numbers)[::-1]] = np.arange(len(numbers))[::-1]
+    return turn_of[boards]
+
+
+def standings(numbers: Sequence[int], boards: Boards) -> Standings:
+    turns = cell_turns(numbers, boards)
+    # A line is complete once its last cell is marked, and a board wins
+    # with its first complete line.
+    win_turns = np.minimum(
+        turns.max(axis=2).min(axis=1), turns.max(axis=1).min(axis=1)
+    )
+    unmarked = np.where(turns > win_turns[:, None, None], boards, 0)
+    called = np.append(numbers, 0)[win_turns]
+    return Standings(
+        np.argsort(win_turns, kind='stable'),
+        win_turns,
+        unmarked.sum(axis=(1, 2)) * called,
+    )
+
+
+@dataclass(frozen=True)
+class BoardResult:
+    board: int
+    win_turn: int
+    score: int
+
+
+def board_batches(
+    raw_lines: Iterable[str],
+    batch_boards: int,
+) -> Iterator[Boards]:
+    cells: list[str] = []
+    for raw_line in raw_lines:
+        # Rows hold five cells each, so batches always end between boards.
+        cells.extend(raw_line.split())
+        if len(cells) == 25 * batch_boards:
+            yield np.array(cells, dtype=np.int64).reshape(-1, 5, 5)
+            cells = []
+    if cells:
+        yield np.array(cells, dtype=np.int64).reshape(-1, 5, 5)
+
+
+def play_tournament(
+    raw_lines: Iterable[str],
+    batch_boards: int = BATCH_BOARDS,
+) -> tuple[BoardResult, BoardResult]:
+    """The first and last boards to win, reading a batch at a time."""
+    raw_lines = iter(raw_lines)
+    numbers = parse_numbers(next(raw_lines))
+    first: BoardResult | None = None
+    last: BoardResult | None = None
+    seen = 0
+    for boards in board_batches(raw_lines, batch_boards):
+        results = standings(numbers, boards)
+        batch_first, batch_last = (
+            BoardResult(
+                seen + int(board),
+                int(results.win_turns[board]),
+                int(results.scores[board]),
+            )
+            for board in (results.ranking[0], results.ranking[-1])
+        )
+        # Ties go the same way as in a stable sort of all the boards.
+        if first is None or batch_first.win_turn < first.win_turn:
+            first = batch_first
+        if last is None or batch_last.win_turn >= last.win_turn:
+            last = batch_last
+        seen += len(boards)
+    if first is None or last is None:
+        raise ValueError('no boards to play')
+    return first, last
 
 
-def main() -> None:
-    with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
-        raw_numbers = f.readline()
-        raw_boards = f.read().strip().split('\n\n')
+def parse_input(raw_input: str) -> tuple[list[int], Boards]:
+    raw_numbers, raw_boards = raw_input.split('\n', maxsplit=1)
+    return parse_numbers(raw_numbers), parse_boards(raw_boards)
+
+
+def part_1(bingo: tuple[list[int], Boards]) -> int:
+    results = standings(*bingo)
+    return int(results.scores[results.ranking[0]])
+
 
-    numbers = parse_numbers(raw_numbers)
-    games = [Game.parse(raw_board) for raw_board in raw_boards]
+def part_2(bingo: tuple[list[int], Boards]) -> int:
+    results = standings(*bingo)
+    return int(results.scores[results.ranking[-1]])
 
-    winner, winning_number = simulate_winning(games, numbers)
-    answer_1 = winner.sum_unmarked() * winning_number
 
+def solve(raw_input: str) -> tuple[int, int]:
+    puzzle_input = parse_input(raw_input)
+    return part_1(puzzle_input), part_2(puzzle_input)
+
+
+def main() -> None:
+    first, last = play_tournament(read_lines(f'{SCRIPT_DIR}/input.txt'))
+
+    answer_1 = first.score
     assert answer_1 == 49686
     print(answer_1)
 
-    loser, losing_number = simulate_losing(games, numbers)
-    answer_2 = loser.sum_unmarked() * losing_number
-
+    answer_2 = last.score
     assert answer_2 == 26878
     print(answer_2)
 
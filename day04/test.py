@@ -1,3 +1,5 @@
+import numpy as np
+
 from . import main
 
 
@@ -32,3 +34,45 @@ def test_col_won() -> None:
         assert not game.won()
     game.mark(24)
     assert game.won()
+
+
+def test_bingo_draw() -> None:
+    board = (
+        (1, 2, 3, 4, 5),
+        (6, 7, 8, 9, 10),
+        (11, 12, 13, 14, 15),
+        (16, 17, 18, 19, 20),
+        (21, 22, 23, 24, 25),
+    )
+    doubled = main.parse_board('\n'.join(
+        ' '.join(str(2 * n) for n in row) for row in board
+    ))
+    bingo = main.Bingo([board, doubled])
+    for number in [3, 8, 13, 18]:
+        assert bingo.draw(number) == []
+    first, second = bingo.games
+    assert bingo.draw(23) == [first]
+    assert bingo.draw(23) == []
+    assert not second.won()
+
+
+def test_standings() -> None:
+    boards = np.arange(1, 26).reshape(1, 5, 5) * np.array([1, 2, 100])[
+        :, None, None
+    ]
+    results = main.standings([2, 4, 6, 8, 10, 1, 3, 5], boards)
+    assert results.ranking.tolist() == [1, 0, 2]
+    assert results.win_turns.tolist() == [7, 4, 8]
+    assert results.scores.tolist() == [1430, 6200, 0]
+
+
+def test_play_tournament() -> None:
+    with open(f'{main.SCRIPT_DIR}/input.txt', 'r') as f:
+        raw_input = f.read()
+    bingo = main.parse_input(raw_input)
+    for batch_boards in (1, 7, 1000):
+        first, last = main.play_tournament(
+            raw_input.splitlines(), batch_boards
+        )
+        assert first.score == main.part_1(bingo)
+        assert last.score == main.part_2(bingo)
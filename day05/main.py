@@ -1,13 +1,34 @@
-from collections import defaultdict
+from bisect import bisect_left, bisect_right, insort
+import itertools
 import os.path
-from typing import Iterator, MutableMapping
+from typing import Iterable, Iterator
+
+import numpy as np
+import numpy.typing as np_typing
+
+from aoc.loader import read_lines
 
 SCRIPT_DIR = os.path.dirname(os.path.relpath(__file__))
+# Largest counter array to allocate at once; bigger fields are tiled.
+MAX_CELLS = 1 << 22
+# Beyond this many cells in the bounding box, sweeping beats rasterizing.
+MAX_AREA = 1 << 28
+
+# Each family of lines keeps a * x + b * y constant, given here as (a, b).
+# Positions along a line are its x, except on vertical lines.
+HORIZONTAL, VERTICAL, DIAGONAL, ANTIDIAGONAL = (0, 1), (1, 0), (-1, 1), (1, 1)
+FAMILIES = (HORIZONTAL, VERTICAL, DIAGONAL, ANTIDIAGONAL)
+
+# Sweep events at the same coordinate are handled in this order.
+LEAVE, ENTER, QUERY = range(3)
 
 
 Point = tuple[int, int]
 Line = tuple[Point, Point]
-Atlas = MutableMapping[Point, int]
+# Lines as rows of start_x, start_y, end_x, end_y.
+Segments = np_typing.NDArray[np.int64]
+# Stretches of the lines of one family, as rows of key, first, last.
+Intervals = np_typing.NDArray[np.int64]
 
 
 def my_range(start: int, end: int) -> Iterator[int]:
@@ -74,29 +95,255 @@ def diag_line_range(diag_line: Line) -> Iterator[Point]:
     yield from zip(my_range(start_x, end_x), my_range(start_y, end_y))
 
 
+def to_segments(lines: list[Line]) -> Segments:
+    return np.array(lines, dtype=np.int64).reshape(-1, 4)
+
+
+def orthogonal(segments: Segments) -> Segments:
+    start_x, start_y, end_x, end_y = segments.T
+    return segments[(start_x == end_x) | (start_y == end_y)]
+
+
+def diagonal(segments: Segments) -> Segments:
+    start_x, start_y, end_x, end_y = segments.T
+    is_diagonal = (
+        (np.abs(end_x - start_x) == np.abs(end_y - start_y))
+        & (start_x != end_x)
+    )
+    return segments[is_diagonal]
+
+
+def rasterize(
+    segments: Segments,
+    min_x: int,
+    max_x: int,
+) -> tuple[np_typing.NDArray[np.int64], np_typing.NDArray[np.int64]]:
+    """The x and y of every point on the segments with min_x <= x < max_x."""
+    start_x, start_y, end_x, end_y = segments.T
+    step_x, step_y = np.sign(end_x - start_x), np.sign(end_y - start_y)
+    last = np.maximum(np.abs(end_x - start_x), np.abs(end_y - start_y))
+
+    # Steps along each segment where it is inside the x range. Vertical
+    # segments are either wholly inside or wholly outside.
+    inside = (min_x <= start_x) & (start_x < max_x)
+    to_min, to_max = step_x * (min_x - start_x), step_x * (max_x - 1 - start_x)
+    first_step = np.where(
+        step_x == 0, np.where(inside, 0, last + 1),
+        np.maximum(0, np.minimum(to_min, to_max)),
+    )
+    last_step = np.where(
+        step_x == 0, last, np.minimum(last, np.maximum(to_min, to_max))
+    )
+    lengths = np.maximum(last_step - first_step + 1, 0)
+
+    segment = np.repeat(np.arange(len(segments)), lengths)
+    run_starts = np.cumsum(lengths) - lengths
+    steps = (
+        np.arange(len(segment)) - run_starts[segment] + first_step[segment]
+    )
+    xs = start_x[segment] + step_x[segment] * steps
+    ys = start_y[segment] + step_y[segment] * steps
+    return xs, ys
+
+
+def count_overlaps(segments: Segments, max_cells: int = MAX_CELLS) -> int:
+    """Points covered by at least two segments, counted on a dense grid."""
+    if len(segments) == 0:
+        return 0
+    xs, ys = segments[:, 0::2], segments[:, 1::2]
+    min_x, max_x = int(xs.min()), int(xs.max()) + 1
+    min_y, height = int(ys.min()), int(ys.max()) + 1 - int(ys.min())
+    # Tiles are whole columns, so a column taller than max_cells can't be
+    # counted within the cap.
+    if (max_x - min_x) * height > MAX_AREA or height > max_cells:
+        return count_overlaps_sweep(segments)
+    tile_width = max(1, max_cells // height)
+
+    overlaps = 0
+    for tile_x in range(min_x, max_x, tile_width):
+        tile_xs, tile_ys = rasterize(segments, tile_x, tile_x + tile_width)
+        cells = (tile_xs - tile_x) * height + (tile_ys - min_y)
+        overlaps += int(np.count_nonzero(np.bincount(cells) > 1))
+    return overlaps
+
+
+def family_intervals(segments: Segments) -> list[Intervals]:
+    """Split the segments by family, as intervals on their own lines."""
+    start_x, start_y, end_x, end_y = segments.T
+    step_x, step_y = end_x - start_x, end_y - start_y
+    # Single points count as horizontal.
+    in_families = (
+        step_y == 0,
+        (step_x == 0) & (step_y != 0),
+        (step_x == step_y) & (step_x != 0),
+        (step_x == -step_y) & (step_x != 0),
+    )
+    if np.sum(in_families) != len(segments):
+        raise ValueError('lines must be horizontal, vertical or diagonal')
+
+    families = []
+    for (a, b), in_family in zip(FAMILIES, in_families):
+        keys = a * start_x[in_family] + b * start_y[in_family]
+        starts, ends = (
+            (start_y, end_y) if (a, b) == VERTICAL else (start_x, end_x)
+        )
+        families.append(np.stack([
+            keys,
+            np.minimum(starts[in_family], ends[in_family]),
+            np.maximum(starts[in_family], ends[in_family]),
+        ], axis=1))
+    return families
+
+
+def coverage(intervals: Intervals, depth: int) -> Intervals:
+    """The stretches of each line covered by at least depth intervals."""
+    keys = np.concatenate([intervals[:, 0], intervals[:, 0]])
+    positions = np.concatenate([intervals[:, 1], intervals[:, 2] + 1])
+    deltas = np.repeat([1, -1], len(intervals))
+    order = np.lexsort((positions, keys))
+    keys, positions = keys[order], positions[order]
+    # Every line's events add up to zero, so the total can run across them.
+    depths = np.cumsum(deltas[order])[:-1]
+    covered = (
+        (keys[:-1] == keys[1:])
+        & (positions[:-1] < positions[1:])
+        & (depths >= depth)
+    )
+    return np.stack([
+        keys[:-1][covered], positions[:-1][covered], positions[1:][covered] - 1
+    ], axis=1)
+
+
+def key_ranges(
+    family: Point,
+    intervals: Intervals,
+    other: Point,
+) -> tuple[np_typing.NDArray[np.int64], np_typing.NDArray[np.int64]]:
+    """The lowest and highest key of the other family along each interval."""
+    a, b = family
+    keys, firsts, lasts = intervals.T
+    ends = []
+    for positions in (firsts, lasts):
+        # b is 1 for every family but the vertical one.
+        xs, ys = (
+            (keys, positions) if family == VERTICAL
+            else (positions, keys - a * positions)
+        )
+        ends.append(other[0] * xs + other[1] * ys)
+    return np.minimum(*ends), np.maximum(*ends)
+
+
+def crossings(
+    family: Point,
+    intervals: Intervals,
+    other: Point,
+    other_intervals: Intervals,
+) -> Iterator[Point]:
+    """Points where an interval of one family meets one of another."""
+    events = []
+    lows, highs = key_ranges(family, intervals, other)
+    for key, low, high in zip(
+        intervals[:, 0].tolist(), lows.tolist(), highs.tolist()
+    ):
+        events.append((low, ENTER, key, key))
+        events.append((high + 1, LEAVE, key, key))
+    lows, highs = key_ranges(other, other_intervals, family)
+    for other_key, low, high in zip(
+        other_intervals[:, 0].tolist(), lows.tolist(), highs.tolist()
+    ):
+        events.append((other_key, QUERY, low, high))
+    events.sort()
+
+    (a, b), (c, d) = family, other
+    determinant = a * d - b * c
+    active: list[int] = []
+    for other_key, kind, low, high in events:
+        if kind == LEAVE:
+            del active[bisect_left(active, low)]
+        elif kind == ENTER:
+            insort(active, low)
+        else:
+            for key in active[
+                bisect_left(active, low):bisect_right(active, high)
+            ]:
+                # Diagonals can cross between points, leaving a remainder.
+                x, x_rest = divmod(key * d - b * other_key, determinant)
+                y, y_rest = divmod(a * other_key - c * key, determinant)
+                if x_rest == 0 and y_rest == 0:
+                    yield x, y
+
+
+def is_covered(
+    point: Point,
+    family: Point,
+    stretches: list[list[int]],
+) -> bool:
+    """Whether the point is on one of the sorted key, first, last rows."""
+    x, y = point
+    key = family[0] * x + family[1] * y
+    position = y if family == VERTICAL else x
+    index = bisect_right(stretches, [key, position + 1]) - 1
+    return (
+        index >= 0
+        and stretches[index][0] == key
+        and stretches[index][2] >= position
+    )
+
+
+def count_overlaps_sweep(segments: Segments) -> int:
+    """Points covered by at least two segments, without rasterizing."""
+    families = family_intervals(segments)
+    covered = [coverage(intervals, 1) for intervals in families]
+    twice = [coverage(intervals, 2) for intervals in families]
+    overlaps = sum(int(np.sum(rows[:, 2] - rows[:, 1] + 1)) for rows in twice)
+
+    crossed: set[Point] = set()
+    for f, g in itertools.combinations(range(len(FAMILIES)), 2):
+        crossed.update(
+            crossings(FAMILIES[f], covered[f], FAMILIES[g], covered[g])
+        )
+    stretches = [rows.tolist() for rows in twice]
+    for point in crossed:
+        # Already counted once for each family covering it twice.
+        overlaps += 1 - sum(
+            is_covered(point, family, family_stretches)
+            for family, family_stretches in zip(FAMILIES, stretches)
+        )
+    return overlaps
+
+
+def parse_lines(raw_lines: Iterable[str]) -> list[Line]:
+    return [parse_line(raw_line) for raw_line in raw_lines]
+
+
+def parse_input(raw_input: str) -> list[Line]:
+    return parse_lines(raw_input.splitlines())
+
+
+def part_1(lines: list[Line]) -> int:
+    return count_overlaps(orthogonal(to_segments(lines)))
+
+
+def part_2(lines: list[Line]) -> int:
+    segments = to_segments(lines)
+    return count_overlaps(
+        np.concatenate([orthogonal(segments), diagonal(segments)])
+    )
+
+
+def solve(raw_input: str) -> tuple[int, int]:
+    puzzle_input = parse_input(raw_input)
+    return part_1(puzzle_input), part_2(puzzle_input)
+
+
 def main() -> None:
-    with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
-        lines = [parse_line(raw_line) for raw_line in f.readlines()]
-
-    atlas: Atlas = defaultdict(int)
-    for line in lines:
-        if line_is_hor(line):
-            for p in hor_line_range(line):
-                atlas[p] += 1
-        elif line_is_ver(line):
-            for p in ver_line_range(line):
-                atlas[p] += 1
-
-    answer_1 = sum(1 for value in atlas.values() if value > 1)
+    lines = parse_lines(read_lines(f'{SCRIPT_DIR}/input.txt'))
+
+    answer_1 = part_1(lines)
     assert answer_1 == 5835
     print(answer_1)
 
-    for line in lines:
-        if line_is_diag(line):
-            for p in diag_line_range(line):
-                atlas[p] += 1
-
-    answer_2 = sum(1 for value in atlas.values() if value > 1)
+    answer_2 = part_2(lines)
     assert answer_2 == 17013
     print(answer_2)
 
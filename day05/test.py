@@ -1,3 +1,6 @@
+from collections import Counter
+import random
+
 from . import main
 
 
@@ -11,3 +14,63 @@ def test_my_range_backwards() -> None:
 
 def test_main() -> None:
     main.main()
+
+
+def random_lines(rng: random.Random, count: int) -> list[main.Line]:
+    lines = []
+    for _ in range(count):
+        x, y = rng.randrange(-20, 20), rng.randrange(-20, 20)
+        length = rng.randrange(0, 15)
+        dx, dy = rng.choice([(1, 0), (0, 1), (1, 1), (1, -1)])
+        if rng.random() < 0.5:
+            dx, dy = -dx, -dy
+        lines.append(((x, y), (x + dx * length, y + dy * length)))
+    return lines
+
+
+def brute_force_overlaps(lines: list[main.Line]) -> int:
+    covered = Counter(
+        point
+        for line in lines
+        for point in (
+            main.hor_line_range(line) if main.line_is_hor(line)
+            else main.ver_line_range(line) if main.line_is_ver(line)
+            else main.diag_line_range(line)
+        )
+    )
+    return sum(1 for count in covered.values() if count > 1)
+
+
+def test_count_overlaps_tiled() -> None:
+    rng = random.Random(0)
+    for _ in range(20):
+        lines = random_lines(rng, 30)
+        expected = brute_force_overlaps(lines)
+        segments = main.to_segments(lines)
+        for max_cells in (1, 50, main.MAX_CELLS):
+            assert main.count_overlaps(segments, max_cells) == expected
+
+
+def test_count_overlaps_sweep() -> None:
+    rng = random.Random(1)
+    for _ in range(50):
+        lines = random_lines(rng, 30)
+        segments = main.to_segments(lines)
+        expected = brute_force_overlaps(lines)
+        assert main.count_overlaps_sweep(segments) == expected
+
+
+def test_count_overlaps_sweep_huge_field() -> None:
+    lines = [
+        ((0, 0), (10**9, 10**9)),
+        ((10**9, 0), (0, 10**9)),
+        ((0, 5 * 10**8), (10**9, 5 * 10**8)),
+        ((0, 10**9), (10**9, 10**9)),
+        ((10**9 - 1, 10**9), (10**9, 10**9)),
+    ]
+    assert main.count_overlaps(main.to_segments(lines)) == 4
+
+
+def test_count_overlaps_tall_field() -> None:
+    lines = [((0, 0), (0, 20_000_000)), ((0, 5), (0, 10))]
+    assert main.count_overlaps(main.to_segments(lines)) == 6
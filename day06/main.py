@@ -1,8 +1,27 @@
 from collections import Counter
+from functools import cache
 import os.path
+from typing import Iterable, Sequence
 
 SCRIPT_DIR = os.path.dirname(os.path.relpath(__file__))
 
+TIMERS = 9
+RESET = 6
+
+# Square matrices as lists of rows, kept in Python ints so they never
+# overflow.
+Matrix = list[list[int]]
+Vector = list[int]
+
+# One day as a matrix: new_timers[i] = sum(TRANSITION[i][j] * timers[j]).
+TRANSITION = [
+    [
+        int(j == i + 1 or (j == 0 and i in (RESET, TIMERS - 1)))
+        for j in range(TIMERS)
+    ]
+    for i in range(TIMERS)
+]
+
 
 def parse_timer_list(raw_timer_list: str) -> list[int]:
     return [int(timer) for timer in raw_timer_list.strip().split(',')]
@@ -23,23 +42,110 @@ def tick_timers(timers: dict[int, int]) -> dict[int, int]:
     return new_timers
 
 
+def reduce(value: int, modulus: int | None) -> int:
+    return value if modulus is None else value % modulus
+
+
+def multiply(a: Matrix, b: Matrix, modulus: int | None = None) -> Matrix:
+    columns = list(zip(*b))
+    return [
+        [
+            reduce(sum(x * y for x, y in zip(row, column)), modulus)
+            for column in columns
+        ]
+        for row in a
+    ]
+
+
+def times(vector: Vector, matrix: Matrix, modulus: int | None) -> Vector:
+    """The row vector times the matrix."""
+    return [
+        reduce(sum(x * y for x, y in zip(vector, column)), modulus)
+        for column in zip(*matrix)
+    ]
+
+
+@cache
+def transition_power(bit: int, modulus: int | None = None) -> Matrix:
+    """TRANSITION ** (2 ** bit), by squaring the previous power."""
+    if bit == 0:
+        return [[reduce(x, modulus) for x in row] for row in TRANSITION]
+    half = transition_power(bit - 1, modulus)
+    return multiply(half, half, modulus)
+
+
+def weights(days: int, modulus: int | None = None) -> Vector:
+    """How many fish each timer value grows into after days."""
+    if days < 0:
+        raise ValueError('days must not be negative')
+    vector = [1] * TIMERS
+    for bit in range(days.bit_length()):
+        if days >> bit & 1:
+            vector = times(vector, transition_power(bit, modulus), modulus)
+    return vector
+
+
+def histogram(timer_list: list[int]) -> Vector:
+    timers = make_timers(timer_list)
+    return [timers.get(timer, 0) for timer in range(TIMERS)]
+
+
+def forecast(
+    histograms: Iterable[Sequence[int]],
+    horizons: Sequence[int],
+    modulus: int | None = None,
+) -> list[list[int]]:
+    """The population of each school after each number of days."""
+    table = [weights(days, modulus) for days in horizons]
+    populations = []
+    for counts in histograms:
+        if len(counts) != TIMERS:
+            raise ValueError(f'histograms must have {TIMERS} timers')
+        counts = [int(count) for count in counts]
+        populations.append([
+            reduce(sum(w * count for w, count in zip(row, counts)), modulus)
+            for row in table
+        ])
+    return populations
+
+
+def simulate(
+    timer_list: list[int],
+    days: int,
+    modulus: int | None = None,
+) -> int:
+    """The population after days, in O(log days) matrix products."""
+    [[population]] = forecast([histogram(timer_list)], [days], modulus)
+    return population
+
+
+def parse_input(raw_input: str) -> list[int]:
+    return parse_timer_list(raw_input)
+
+
+def part_1(timer_list: list[int]) -> int:
+    return simulate(timer_list, 80)
+
+
+def part_2(timer_list: list[int]) -> int:
+    return simulate(timer_list, 256)
+
+
+def solve(raw_input: str) -> tuple[int, int]:
+    puzzle_input = parse_input(raw_input)
+    return part_1(puzzle_input), part_2(puzzle_input)
+
+
 def main() -> None:
     with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
         raw_timer_list = f.read()
-    timer_list = parse_timer_list(raw_timer_list)
-    timers = make_timers(timer_list)
-
-    for _ in range(80):
-        timers = tick_timers(timers)
+    timer_list = parse_input(raw_timer_list)
 
-    answer_1 = sum(timers.values())
+    answer_1 = part_1(timer_list)
     assert answer_1 == 362639
     print(answer_1)
 
-    for _ in range(256 - 80):
-        timers = tick_timers(timers)
-
-    answer_2 = sum(timers.values())
+    answer_2 = part_2(timer_list)
     assert answer_2 == 1639854996917
     print(answer_2)
 
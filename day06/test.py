@@ -3,3 +3,36 @@ from . import main
 
 def test_main() -> None:
     main.main()
+
+
+def simulate_by_day(timer_list: list[int], days: int) -> int:
+    timers = main.make_timers(timer_list)
+    for _ in range(days):
+        timers = main.tick_timers(timers)
+    return sum(timers.values())
+
+
+def test_simulate() -> None:
+    timer_list = [3, 4, 3, 1, 2]
+    for days in (0, 1, 2, 7, 18, 80, 100, 257):
+        expected = simulate_by_day(timer_list, days)
+        assert main.simulate(timer_list, days) == expected
+        assert main.simulate(timer_list, days, 1009) == expected % 1009
+
+
+def test_simulate_far_horizon() -> None:
+    modulus = 1_000_000_007
+    assert main.simulate([3, 4, 3, 1, 2], 10**12, modulus) < modulus
+    assert main.simulate([3], 10**6).bit_length() > 100_000
+
+
+def test_forecast() -> None:
+    schools: list[list[int]] = [[3, 4, 3, 1, 2], [0], [8, 8, 1], []]
+    horizons = [0, 80, 256, 18]
+    populations = main.forecast(
+        [main.histogram(school) for school in schools], horizons
+    )
+    assert populations == [
+        [simulate_by_day(school, days) for days in horizons]
+        for school in schools
+    ]
@@ -1,36 +1,107 @@
-from statistics import median
+from dataclasses import dataclass
 import os.path
 
+import numpy as np
+import numpy.typing as np_typing
+
+from aoc.parsing import parse_ints
+
 SCRIPT_DIR = os.path.dirname(os.path.relpath(__file__))
 
+Positions = np_typing.NDArray[np.int64]
+
 
-def parse_positions(raw_timer_list: str) -> list[int]:
-    return [int(timer) for timer in raw_timer_list.strip().split(',')]
+def parse_positions(raw_positions: str) -> Positions:
+    return parse_ints(raw_positions, ',')
 
 
 def triangular(n: int) -> int:
     return n * (n + 1) // 2
 
 
-def linear_fuel_cost(positions: list[int], position: int) -> int:
-    return sum(abs(position - p) for p in positions)
+def linear_fuel_cost(positions: Positions, position: int) -> int:
+    return int(np.sum(np.abs(positions - position)))
+
+
+def triangular_fuel_cost(positions: Positions, position: int) -> int:
+    distances = np.abs(positions - position)
+    return int(np.sum(distances * (distances + 1) // 2))
+
+
+def best_linear_position(positions: Positions) -> int:
+    """A median, which no move can improve on linear costs."""
+    middle = (len(positions) - 1) // 2
+    return int(np.partition(positions, middle)[middle])
+
+
+def best_triangular_positions(positions: Positions) -> range:
+    """The integers around the mean, one of which is the cheapest."""
+    total, count = int(np.sum(positions)), len(positions)
+    low = (2 * total - count) // (2 * count)
+    high = -(-(2 * total + count) // (2 * count))
+    return range(low, high + 1)
+
+
+@dataclass(frozen=True)
+class CostCurves:
+    """Fuel costs at every integer position from first to the last crab."""
+    first: int
+    linear: Positions
+    triangular: Positions
+
+    def __len__(self) -> int:
+        return len(self.linear)
+
+
+def cost_curves(positions: Positions) -> CostCurves:
+    """Both cost curves from prefix sums, in O(n + range)."""
+    first = int(positions.min())
+    counts = np.bincount(positions - first)
+    offsets = np.arange(len(counts), dtype=np.int64)
+    count, total = len(positions), int(np.sum(offsets * counts))
+    squares = int(np.sum(offsets * offsets * counts))
+
+    counts_left = np.cumsum(counts)
+    sums_left = np.cumsum(offsets * counts)
+    linear = (
+        offsets * counts_left - sums_left
+        + (total - sums_left) - offsets * (count - counts_left)
+    )
+    squared = squares - 2 * offsets * total + count * offsets * offsets
+    # A triangular distance is (d ** 2 + d) / 2.
+    return CostCurves(first, linear, (squared + linear) // 2)
+
+
+def parse_input(raw_input: str) -> Positions:
+    return parse_positions(raw_input)
+
+
+def part_1(positions: Positions) -> int:
+    return linear_fuel_cost(positions, best_linear_position(positions))
+
+
+def part_2(positions: Positions) -> int:
+    return min(
+        triangular_fuel_cost(positions, p)
+        for p in best_triangular_positions(positions)
+    )
 
 
-def triangular_fuel_cost(positions: list[int], position: int) -> int:
-    return sum(triangular(abs(position - p)) for p in positions)
+def solve(raw_input: str) -> tuple[int, int]:
+    puzzle_input = parse_input(raw_input)
+    return part_1(puzzle_input), part_2(puzzle_input)
 
 
 def main() -> None:
     with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
         raw_positions = f.read()
-    positions = parse_positions(raw_positions)
+    positions = parse_input(raw_positions)
 
-    best_position = int(median(positions))
-    answer_1 = linear_fuel_cost(positions, best_position)
+    answer_1 = part_1(positions)
     assert answer_1 == 341558
     print(answer_1)
 
-    answer_2 = min(triangular_fuel_cost(positions, p) for p in set(positions))
+    answer_2 = part_2(positions)
     assert answer_2 == 93214037
     print(answer_2)
 
@@ -1,5 +1,36 @@
+import numpy as np
+
 from . import main
 
 
 def test_main() -> None:
     main.main()
+
+
+def test_best_positions() -> None:
+    rng = np.random.default_rng(0)
+    for _ in range(50):
+        positions = rng.integers(0, 50, size=rng.integers(1, 20))
+        candidates = range(int(positions.min()), int(positions.max()) + 1)
+        assert main.part_1(positions) == min(
+            sum(abs(p - int(x)) for x in positions) for p in candidates
+        )
+        assert main.part_2(positions) == min(
+            sum(main.triangular(abs(p - int(x))) for x in positions)
+            for p in candidates
+        )
+
+
+def test_cost_curves() -> None:
+    positions = main.parse_positions('16,1,2,0,4,2,7,1,2,14')
+    curves = main.cost_curves(positions)
+    assert (curves.first, len(curves)) == (0, 17)
+    for offset in range(len(curves)):
+        position = curves.first + offset
+        assert curves.linear[offset] == (
+            main.linear_fuel_cost(positions, position)
+        )
+        assert curves.triangular[offset] == (
+            main.triangular_fuel_cost(positions, position)
+        )
+    assert curves.linear.min() == 37 and curves.triangular.min() == 168
@@ -1,5 +1,8 @@
 from dataclasses import dataclass
 import os.path
+from typing import Iterable
+
+from aoc.loader import read_lines
 
 SCRIPT_DIR = os.path.dirname(os.path.relpath(__file__))
 
@@ -59,26 +62,46 @@ def identify_output(display_entry: DisplayEntry) -> int:
     return int(''.join(identify_digit(d, digits) for d in output))
 
 
-def main() -> None:
-    with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
-        display_entries = [
-            parse_display_entry(raw_display_entry)
-            for raw_display_entry in f.readlines()
-        ]
+def parse_lines(raw_lines: Iterable[str]) -> list[DisplayEntry]:
+    return [
+        parse_display_entry(raw_display_entry)
+        for raw_display_entry in raw_lines
+    ]
+
+
+def parse_input(raw_input: str) -> list[DisplayEntry]:
+    return parse_lines(raw_input.splitlines())
+
 
-    answer_1 = sum(
+def part_1(display_entries: list[DisplayEntry]) -> int:
+    return sum(
         1
         for display_entry in display_entries
         for digit in display_entry.output
         if len(digit) in (2, 3, 4, 7)
     )
-    assert answer_1 == 383
-    print(answer_1)
 
-    answer_2 = sum(
+
+def part_2(display_entries: list[DisplayEntry]) -> int:
+    return sum(
         identify_output(display_entry)
         for display_entry in display_entries
     )
+
+
+def solve(raw_input: str) -> tuple[int, int]:
+    puzzle_input = parse_input(raw_input)
+    return part_1(puzzle_input), part_2(puzzle_input)
+
+
+def main() -> None:
+    display_entries = parse_lines(read_lines(f'{SCRIPT_DIR}/input.txt'))
+
+    answer_1 = part_1(display_entries)
+    assert answer_1 == 383
+    print(answer_1)
+
+    answer_2 = part_2(display_entries)
     assert answer_2 == 998900
     print(answer_2)
 
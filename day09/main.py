@@ -1,15 +1,16 @@
-from typing import Iterator
 import os.path
 
+import numpy as np
+
+from aoc import grid
+from aoc.loader import Buffer, mapped
+
 SCRIPT_DIR = os.path.dirname(os.path.relpath(__file__))
 MAX_HEIGHT = 9
+PADDING = 2
 Point = tuple[int, int]
 
 
-def parse_heights(raw_rows: list[str]) -> list[list[int]]:
-    return [[int(h) for h in raw_row.strip()] for raw_row in raw_rows]
-
-
 def neighbor_indices(x: int, y: int) -> tuple[Point, ...]:
     return (
         (x - 1, y),
@@ -21,27 +22,16 @@ def neighbor_indices(x: int, y: int) -> tuple[Point, ...]:
 
 class HeightMap:
 
-    def __init__(self, heights: list[list[int]]):
-        self._heights = heights
+    def __init__(self, heights: grid.Grid):
+        self.height, self.width = heights.shape
+        # A border of MAX_HEIGHT stands in for bounds checks, since basin()
+        # never looks further than the neighbors of a neighbor.
+        self._heights = grid.pad(heights, MAX_HEIGHT, PADDING)
 
     def __getitem__(self, point: Point) -> int:
         x, y = point
-        if x < 0 or y < 0:
-            return MAX_HEIGHT
-        try:
-            return self._heights[y][x]
-        except IndexError:
-            return MAX_HEIGHT
-
-    def __iter__(self) -> Iterator[int]:
-        yield from (h for row in self._heights for h in row)
-
-    def indices(self) -> Iterator[Point]:
-        yield from (
-            (x, y)
-            for y in range(len(self._heights))
-            for x in range(len(self._heights[y]))
-        )
+        height: int = self._heights.item(y + PADDING, x + PADDING)
+        return height
 
     def neighbors(
         self, x: int,
@@ -51,8 +41,20 @@ class HeightMap:
         _neighbors = set(neighbor_indices(x, y)) - excluding
         return tuple(self[xx, yy] for xx, yy in _neighbors)
 
-    def is_min(self, x: int, y: int) -> bool:
-        return self[x, y] < min(self.neighbors(x, y))
+    def minima(self) -> dict[Point, int]:
+        inner = self._heights[
+            PADDING:PADDING + self.height, PADDING:PADDING + self.width
+        ]
+        is_min = np.ones(inner.shape, dtype=bool)
+        for di, dj in grid.ORTHOGONAL:
+            is_min &= inner < self._heights[
+                PADDING + di:PADDING + di + self.height,
+                PADDING + dj:PADDING + dj + self.width,
+            ]
+        return {
+            (int(x), int(y)): int(inner[y, x])
+            for y, x in zip(*np.nonzero(is_min))
+        }
 
 
 def basin(height_map: HeightMap, x: int, y: int) -> set[Point]:
@@ -74,24 +76,39 @@ def basin(height_map: HeightMap, x: int, y: int) -> set[Point]:
     return partial_basin
 
 
+def parse_buffer(buffer: Buffer) -> HeightMap:
+    return HeightMap(grid.parse_digits(buffer))
+
+
+def parse_input(raw_input: str) -> HeightMap:
+    return HeightMap(grid.parse_digits(raw_input))
+
+
+def part_1(height_map: HeightMap) -> int:
+    mins = height_map.minima()
+    return sum(mins.values()) + len(mins)
+
+
+def part_2(height_map: HeightMap) -> int:
+    mins = height_map.minima()
+    *_, a, b, c = sorted(len(basin(height_map, x, y)) for x, y in mins.keys())
+    return a * b * c
+
+
+def solve(raw_input: str) -> tuple[int, int]:
+    puzzle_input = parse_input(raw_input)
+    return part_1(puzzle_input), part_2(puzzle_input)
+
+
 def main() -> None:
-    with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
-        raw_rows = f.readlines()
-    heights = parse_heights(raw_rows)
-
-    height_map = HeightMap(heights)
-    mins = {
-        (x, y): h
-        for h, (x, y) in zip(height_map, height_map.indices())
-        if height_map.is_min(x, y)
-    }
-
-    answer_1 = sum(mins.values()) + len(mins)
+    with mapped(f'{SCRIPT_DIR}/input.txt') as buffer:
+        height_map = parse_buffer(buffer)
+
+    answer_1 = part_1(height_map)
     assert answer_1 == 607
     print(answer_1)
 
-    *_, a, b, c = sorted(len(basin(height_map, x, y)) for x, y in mins.keys())
-    answer_2 = a * b * c
+    answer_2 = part_2(height_map)
     assert answer_2 == 900864
     print(answer_2)
 
@@ -1,7 +1,9 @@
 from dataclasses import dataclass
 import os.path
 from statistics import median
-from typing import NoReturn
+from typing import Iterable, NoReturn
+
+from aoc.loader import read_lines
 
 SCRIPT_DIR = os.path.dirname(os.path.relpath(__file__))
 
@@ -68,11 +70,9 @@ def completion_line_score(completion_line: str) -> int:
     return score
 
 
-def main() -> None:
-    with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
-        lines = f.readlines()
-
-    parse_results = (try_parse(line.strip()) for line in lines)
+def split_parse_results(
+    parse_results: list[ErrorChar | IncompleteStack],
+) -> tuple[list[str], list[str]]:
     error_chars = []
     incomplete_stacks = []
     for parse_result in parse_results:
@@ -82,15 +82,42 @@ def main() -> None:
             incomplete_stacks.append(parse_result.stack)
         else:
             absurd(parse_result)
-    answer_1 = sum(ERROR_CHAR_SCORE.get(char, 0) for char in error_chars)
+    return error_chars, incomplete_stacks
 
-    assert answer_1 == 240123
-    print(answer_1)
 
+def parse_lines(raw_lines: Iterable[str]) -> list[ErrorChar | IncompleteStack]:
+    return [try_parse(line.strip()) for line in raw_lines]
+
+
+def parse_input(raw_input: str) -> list[ErrorChar | IncompleteStack]:
+    return parse_lines(raw_input.splitlines())
+
+
+def part_1(parse_results: list[ErrorChar | IncompleteStack]) -> int:
+    error_chars, _ = split_parse_results(parse_results)
+    return sum(ERROR_CHAR_SCORE.get(char, 0) for char in error_chars)
+
+
+def part_2(parse_results: list[ErrorChar | IncompleteStack]) -> int:
+    _, incomplete_stacks = split_parse_results(parse_results)
     completion_lines = [completion_line(stack) for stack in incomplete_stacks]
     completion_scores = [completion_line_score(li) for li in completion_lines]
-    answer_2 = median(completion_scores)
+    return int(median(completion_scores))
+
+
+def solve(raw_input: str) -> tuple[int, int]:
+    puzzle_input = parse_input(raw_input)
+    return part_1(puzzle_input), part_2(puzzle_input)
+
+
+def main() -> None:
+    parse_results = parse_lines(read_lines(f'{SCRIPT_DIR}/input.txt'))
+
+    answer_1 = part_1(parse_results)
+    assert answer_1 == 240123
+    print(answer_1)
 
+    answer_2 = part_2(parse_results)
     assert answer_2 == 3260812321
     print(answer_2)
 
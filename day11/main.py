@@ -1,19 +1,17 @@
 import numpy as np
-import numpy.typing as np_typing
 import os.path
-from scipy.ndimage import convolve
-
-SCRIPT_DIR = os.path.dirname(os.path.relpath(__file__))
-NEIGHBOR_KERNEL = np.array([[1, 1, 1], [1, 0, 1], [1, 1, 1]])
-
-Grid = np_typing.NDArray[np.int64]
 
+from aoc.grid import Grid, parse_digits
+from aoc.loader import Buffer, mapped
 
-def parse_row(raw_row: str) -> list[int]:
-    return [int(cell) for cell in raw_row]
+SCRIPT_DIR = os.path.dirname(os.path.relpath(__file__))
+NEIGHBOR_KERNEL = np.array([[1, 1, 1], [1, 0, 1], [1, 1, 1]], dtype=np.uint8)
 
 
 def simulate_step(grid: Grid) -> tuple[Grid, int]:
+    # Imported here so that loading the module stays cheap.
+    from scipy.ndimage import convolve
+
     new_grid = grid.copy()
     new_grid += 1
 
@@ -21,7 +19,7 @@ def simulate_step(grid: Grid) -> tuple[Grid, int]:
     ever_flash = flash.copy()
     while np.any(flash):
         new_grid += convolve(
-            flash.astype(int), NEIGHBOR_KERNEL, mode='constant'
+            flash.view(np.uint8), NEIGHBOR_KERNEL, mode='constant'
         )
         flash = (new_grid >= 10) & ~ever_flash
         ever_flash |= flash
@@ -30,27 +28,44 @@ def simulate_step(grid: Grid) -> tuple[Grid, int]:
     return new_grid, np.sum(ever_flash)
 
 
-def main() -> None:
-    with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
-        raw_rows = f.readlines()
-    rows = [parse_row(raw_row.strip()) for raw_row in raw_rows]
-    grid = np.array(rows)
+def parse_buffer(buffer: Buffer) -> Grid:
+    return parse_digits(buffer)
+
+
+def parse_input(raw_input: str) -> Grid:
+    return parse_digits(raw_input)
 
+
+def part_1(grid: Grid) -> int:
     flashes = 0
     for _ in range(100):
         grid, new_flashes = simulate_step(grid)
         flashes += new_flashes
+    return int(flashes)
 
-    answer_1 = flashes
-    assert answer_1 == 1757
-    print(answer_1)
 
-    round_count = 100
+def part_2(grid: Grid) -> int:
+    round_count = 0
     while np.sum(grid) > 0:
         grid, _ = simulate_step(grid)
         round_count += 1
+    return round_count
+
+
+def solve(raw_input: str) -> tuple[int, int]:
+    puzzle_input = parse_input(raw_input)
+    return part_1(puzzle_input), part_2(puzzle_input)
+
+
+def main() -> None:
+    with mapped(f'{SCRIPT_DIR}/input.txt') as buffer:
+        grid = parse_buffer(buffer)
+
+    answer_1 = part_1(grid)
+    assert answer_1 == 1757
+    print(answer_1)
 
-    answer_2 = round_count
+    answer_2 = part_2(grid)
     # assert answer_2 == 'there\n'
     print(answer_2)
 
@@ -1,6 +1,8 @@
 from collections import defaultdict
 import os.path
-from typing import Sequence
+from typing import Iterable, Sequence
+
+from aoc.loader import read_lines
 
 SCRIPT_DIR = os.path.dirname(os.path.relpath(__file__))
 
@@ -12,7 +14,7 @@ def parse_edge(edge: str) -> tuple[str, str]:
     return v1, v2
 
 
-def parse_graph(raw_edges: list[str]) -> Graph:
+def parse_graph(raw_edges: Iterable[str]) -> Graph:
     graph = defaultdict(set)
     for raw_edge in raw_edges:
         v1, v2 = parse_edge(raw_edge)
@@ -54,16 +56,35 @@ def paths(
     ]
 
 
+def parse_lines(raw_lines: Iterable[str]) -> Graph:
+    return parse_graph(raw_lines)
+
+
+def parse_input(raw_input: str) -> Graph:
+    return parse_lines(raw_input.splitlines())
+
+
+def part_1(graph: Graph) -> int:
+    return len(paths(graph, 'end', ['start']))
+
+
+def part_2(graph: Graph) -> int:
+    return len(paths(graph, 'end', ['start'], small_cave_bonus=1))
+
+
+def solve(raw_input: str) -> tuple[int, int]:
+    puzzle_input = parse_input(raw_input)
+    return part_1(puzzle_input), part_2(puzzle_input)
+
+
 def main() -> None:
-    with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
-        raw_edges = f.readlines()
-    graph = parse_graph(raw_edges)
-    answer_1 = len(paths(graph, 'end', ['start']))
+    graph = parse_lines(read_lines(f'{SCRIPT_DIR}/input.txt'))
 
+    answer_1 = part_1(graph)
     assert answer_1 == 4411
     print(answer_1)
 
-    answer_2 = len(paths(graph, 'end', ['start'], small_cave_bonus=1))
+    answer_2 = part_2(graph)
     assert answer_2 == 136767
     print(answer_2)
 
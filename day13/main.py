@@ -3,7 +3,8 @@ from functools import reduce
 import os.path
 
 import numpy as np
-import numpy.typing as np_typing
+
+from aoc.grid import Grid, from_points, render
 
 SCRIPT_DIR = os.path.dirname(os.path.relpath(__file__))
 
@@ -19,7 +20,6 @@ class VerticalFold:
 
 
 Fold = HorizontalFold | VerticalFold
-Grid = np_typing.NDArray[np.int64]
 
 
 def parse_raw_instructions(raw_instructions: str) -> tuple[Grid, list[Fold]]:
@@ -30,15 +30,9 @@ def parse_raw_instructions(raw_instructions: str) -> tuple[Grid, list[Fold]]:
 
 
 def parse_raw_points(raw_points: str) -> Grid:
-    indices = [
+    return from_points(
         parse_raw_point(raw_point) for raw_point in raw_points.split('\n')
-    ]
-    max_x = max(x for x, _ in indices) + 1
-    max_y = max(y for _, y in indices) + 1
-    points = np.zeros((max_x, max_y)).astype(bool)
-    for index in indices:
-        points[index] = True
-    return points
+    )
 
 
 def parse_raw_point(raw_point: str) -> tuple[int, int]:
@@ -72,25 +66,38 @@ def apply_fold(points: Grid, fold: Fold) -> Grid:
 
 
 def display_grid(grid: Grid) -> str:
-    return (
-        '\n'.join(
-            ''.join(
-                '\u2588' if cell else ' ' for cell in row
-            ) for row in grid.T
-        )
-    )
+    return render(grid.T, on='\u2588', off=' ')
+
+
+def parse_input(raw_input: str) -> tuple[Grid, list[Fold]]:
+    return parse_raw_instructions(raw_input)
+
+
+def part_1(instructions: tuple[Grid, list[Fold]]) -> int:
+    points, folds = instructions
+    return int(np.sum(apply_fold(points, folds[0])))
+
+
+def part_2(instructions: tuple[Grid, list[Fold]]) -> str:
+    points, folds = instructions
+    return display_grid(reduce(apply_fold, folds, points))
+
+
+def solve(raw_input: str) -> tuple[int, str]:
+    puzzle_input = parse_input(raw_input)
+    return part_1(puzzle_input), part_2(puzzle_input)
 
 
 def main() -> None:
     with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
         raw_instructions = f.read()
-    points, folds = parse_raw_instructions(raw_instructions)
+    instructions = parse_input(raw_instructions)
 
-    answer_1 = np.sum(apply_fold(points, folds[0]))
+    answer_1 = part_1(instructions)
     assert answer_1 == 765
     print(answer_1)
 
-    print(display_grid(reduce(apply_fold, folds, points)))
+    print(part_2(instructions))
     answer_2 = 'RZKZLPGH'
     assert answer_2 == 'RZKZLPGH'
     print(answer_2)
@@ -66,28 +66,50 @@ def count_elements(
     return element_counts
 
 
-def main() -> None:
-    with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
-        raw_puzzle_input = f.read()
-    template, pair_insertion_rules = parse_raw_puzzle_input(raw_puzzle_input)
+def element_spread(
+    template: str,
+    pair_insertion_rules: list[PairInsertionRule],
+    steps: int,
+) -> int:
     pair_counts = count_pairs(template)
-    for _ in range(10):
+    for _ in range(steps):
         pair_counts = apply_pair_insertion_rules(
             pair_insertion_rules, pair_counts
         )
 
     element_counts = count_elements(pair_counts, first=template[0])
-    answer_1 = max(element_counts.values()) - min(element_counts.values())
+    return max(element_counts.values()) - min(element_counts.values())
+
+
+def parse_input(raw_input: str) -> tuple[str, list[PairInsertionRule]]:
+    return parse_raw_puzzle_input(raw_input)
+
+
+def part_1(puzzle_input: tuple[str, list[PairInsertionRule]]) -> int:
+    template, pair_insertion_rules = puzzle_input
+    return element_spread(template, pair_insertion_rules, 10)
+
+
+def part_2(puzzle_input: tuple[str, list[PairInsertionRule]]) -> int:
+    template, pair_insertion_rules = puzzle_input
+    return element_spread(template, pair_insertion_rules, 40)
+
+
+def solve(raw_input: str) -> tuple[int, int]:
+    puzzle_input = parse_input(raw_input)
+    return part_1(puzzle_input), part_2(puzzle_input)
+
+
+def main() -> None:
+    with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
+        raw_puzzle_input = f.read()
+    puzzle_input = parse_input(raw_puzzle_input)
+
+    answer_1 = part_1(puzzle_input)
     assert answer_1 == 4244
     print(answer_1)
 
-    for _ in range(40 - 10):
-        pair_counts = apply_pair_insertion_rules(
-            pair_insertion_rules, pair_counts
-        )
-
-    element_counts = count_elements(pair_counts, first=template[0])
-    answer_2 = max(element_counts.values()) - min(element_counts.values())
+    answer_2 = part_2(puzzle_input)
     assert answer_2 == 4807056953866
     print(answer_2)
 
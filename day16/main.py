@@ -185,17 +185,35 @@ def evaluate_packet(packet: Packet) -> int:
             raise RuntimeError
 
 
+def parse_input(raw_input: str) -> Packet:
+    bin_packet = hex_to_bin(raw_input.strip())
+    packet, _ = parse_bit_queue(BitQueue(bin_packet))
+    return packet
+
+
+def part_1(packet: Packet) -> int:
+    return sum_versions(packet)
+
+
+def part_2(packet: Packet) -> int:
+    return evaluate_packet(packet)
+
+
+def solve(raw_input: str) -> tuple[int, int]:
+    puzzle_input = parse_input(raw_input)
+    return part_1(puzzle_input), part_2(puzzle_input)
+
+
 def main() -> None:
     with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
-        hex_packet = f.read().strip()
-    bin_packet = hex_to_bin(hex_packet)
-    packet, _ = parse_bit_queue(BitQueue(bin_packet))
+        hex_packet = f.read()
+    packet = parse_input(hex_packet)
 
-    answer_1 = sum_versions(packet)
+    answer_1 = part_1(packet)
     assert answer_1 == 971
     print(answer_1)
 
-    answer_2 = evaluate_packet(packet)
+    answer_2 = part_2(packet)
     assert answer_2 == 831996589851
     print(answer_2)
 
@@ -91,17 +91,34 @@ def find_trajectories(target: Target) -> list[tuple[int, int]]:
     ]
 
 
+def parse_input(raw_input: str) -> Target:
+    return parse_target(raw_input)
+
+
+def part_1(target: Target) -> int:
+    v_x, v_y = aim(target)
+    return max_y(trajectory(v_x, v_y))
+
+
+def part_2(target: Target) -> int:
+    return len(find_trajectories(target))
+
+
+def solve(raw_input: str) -> tuple[int, int]:
+    puzzle_input = parse_input(raw_input)
+    return part_1(puzzle_input), part_2(puzzle_input)
+
+
 def main() -> None:
     with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
         raw_target = f.read()
-    target = parse_target(raw_target)
-    v_x, v_y = aim(target)
+    target = parse_input(raw_target)
 
-    answer_1 = max_y(trajectory(v_x, v_y))
+    answer_1 = part_1(target)
     assert answer_1 == 4186
     print(answer_1)
 
-    answer_2 = len(find_trajectories(target))
+    answer_2 = part_2(target)
     assert answer_2 == 2709
     print(answer_2)
 
@@ -1,6 +1,9 @@
 from dataclasses import dataclass
 from itertools import combinations
 import os.path
+from typing import Iterable
+
+from aoc.loader import read_lines
 
 SCRIPT_DIR = os.path.dirname(os.path.relpath(__file__))
 
@@ -114,26 +117,45 @@ def magnitude(surreal: Surreal) -> int:
     return 3 * magnitude(surreal.left) + 2 * magnitude(surreal.right)
 
 
-def main() -> None:
-    with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
-        raw_surreals = f.readlines()
-    surreals = [
+def parse_lines(raw_lines: Iterable[str]) -> list[Surreal]:
+    return [
         parse_surreal(raw_surreal.strip())
-        for raw_surreal in raw_surreals
+        for raw_surreal in raw_lines
     ]
+
+
+def parse_input(raw_input: str) -> list[Surreal]:
+    return parse_lines(raw_input.splitlines())
+
+
+def part_1(surreals: list[Surreal]) -> int:
     acc = surreals[0]
     for summand in surreals[1:]:
         acc += summand
         acc = reduce(acc)
+    return magnitude(acc)
 
-    answer_1 = magnitude(acc)
-    assert answer_1 == 3884
-    print(answer_1)
 
-    answer_2 = max(
+def part_2(surreals: list[Surreal]) -> int:
+    return max(
         max(magnitude(reduce(x + y)), magnitude(reduce(y + x)))
         for x, y in combinations(surreals, 2)
     )
+
+
+def solve(raw_input: str) -> tuple[int, int]:
+    puzzle_input = parse_input(raw_input)
+    return part_1(puzzle_input), part_2(puzzle_input)
+
+
+def main() -> None:
+    surreals = parse_lines(read_lines(f'{SCRIPT_DIR}/input.txt'))
+
+    answer_1 = part_1(surreals)
+    assert answer_1 == 3884
+    print(answer_1)
+
+    answer_2 = part_2(surreals)
     assert answer_2 == 4595
     print(answer_2)
 
@@ -1,5 +1,6 @@
 from collections import defaultdict
 from dataclasses import dataclass
+from functools import cached_property
 from itertools import combinations
 import os.path
 
@@ -138,14 +139,9 @@ def apply_calibration(
     return beacons @ trans + offset
 
 
-def main() -> None:
-    with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
-        raw_scanners = f.read().split('\n\n')
-    scanners = [
-        parse_scanner(raw_scanner)
-        for raw_scanner in raw_scanners
-    ]
-
+def match_points(
+    scanners: list[Scanner],
+) -> dict[tuple[int, int], np_typing.NDArray[np.int64]]:
     matching_points_: defaultdict[tuple[int, int], list[tuple[int, int]]] = (
         defaultdict(list)
     )
@@ -158,10 +154,17 @@ def main() -> None:
                 if count_equal(i_row, j_row) >= 12:
                     matching_points_[(i, j)].append((ii, jj))
                     matching_points_[(j, i)].append((jj, ii))
-    matching_points = {
+    return {
         p: np.array(m) for p, m in matching_points_.items()
     }
 
+
+def calibrate_scanners(
+    scanners: list[Scanner],
+) -> tuple[list[Scanner], dict[int, np_typing.NDArray[np.int64]]]:
+    scanners = list(scanners)
+    matching_points = match_points(scanners)
+
     calibrated_offsets = {0: np.array([0, 0, 0])}
     while len(calibrated_offsets) != len(scanners):
         for (i, j), points in matching_points.items():
@@ -181,20 +184,59 @@ def main() -> None:
                     scanner_j.pairwise_distances
                 )
                 calibrated_offsets[j] = offset
+    return scanners, calibrated_offsets
+
+
+@dataclass
+class Survey:
+    scanners: list[Scanner]
+
+    @cached_property
+    def calibration(
+        self,
+    ) -> tuple[list[Scanner], dict[int, np_typing.NDArray[np.int64]]]:
+        return calibrate_scanners(self.scanners)
+
+
+def parse_input(raw_input: str) -> Survey:
+    return Survey([
+        parse_scanner(raw_scanner)
+        for raw_scanner in raw_input.split('\n\n')
+    ])
 
+
+def part_1(survey: Survey) -> int:
+    scanners, _ = survey.calibration
     deduped_beacons = set.union(*[
         {tuple(beacon) for beacon in scanner.beacon_locs}
         for scanner in scanners
     ])
+    return len(deduped_beacons)
 
-    answer_1 = len(deduped_beacons)
-    assert answer_1 == 326
-    print(answer_1)
 
-    answer_2 = max(
+def part_2(survey: Survey) -> int:
+    _, calibrated_offsets = survey.calibration
+    return int(max(
         np.sum(np.abs(loc1 - loc2))
         for loc1, loc2 in combinations(calibrated_offsets.values(), 2)
-    )
+    ))
+
+
+def solve(raw_input: str) -> tuple[int, int]:
+    puzzle_input = parse_input(raw_input)
+    return part_1(puzzle_input), part_2(puzzle_input)
+
+
+def main() -> None:
+    with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
+        raw_input = f.read()
+    survey = parse_input(raw_input)
+
+    answer_1 = part_1(survey)
+    assert answer_1 == 326
+    print(answer_1)
+
+    answer_2 = part_2(survey)
     assert answer_2 == 10630
     print(answer_2)
 
@@ -1,8 +1,8 @@
 import os.path
 
 import numpy as np
-import numpy.typing as np_typing
-from scipy.signal import convolve2d
+
+from aoc.grid import Grid, parse_cells, render
 
 SCRIPT_DIR = os.path.dirname(os.path.relpath(__file__))
 
@@ -14,56 +14,61 @@ CONV = np.array([
 ])
 
 
-def parse_algo(
-    raw_algo: str
-) -> tuple[np_typing.NDArray[np.int64], np_typing.NDArray[np.int64]]:
+def parse_algo(raw_algo: str) -> tuple[Grid, Grid]:
     raw_compression, raw_image = raw_algo.split('\n\n')
-    compression = np.array([
-        1 if char == '#' else 0
-        for char in raw_compression
-    ])
-    image = np.array([
-        [1 if char == '#' else 0 for char in row]
-        for row in raw_image.splitlines()
-    ])
+    compression = parse_cells(raw_compression)[0]
+    image = parse_cells(raw_image)
     return compression, image
 
 
-def enhance(
-    image: np_typing.NDArray[np.int64],
-    algo: np_typing.NDArray[np.int64],
-    boundary: int
-) -> np_typing.NDArray[np.int64]:
+def enhance(image: Grid, algo: Grid, boundary: int) -> Grid:
+    # Deferred until an image is enhanced; importing scipy is slow.
+    from scipy.signal import convolve2d
+
     enhanced = convolve2d(image, CONV, fillvalue=boundary)
     return algo[enhanced]
 
 
-def show_image(image: np_typing.NDArray[np.int64]) -> str:
-    return '\n'.join(
-        ''.join('#' if pixel else '.' for pixel in row)
-        for row in image
-    )
+def show_image(image: Grid) -> str:
+    return render(image)
+
+
+def enhance_pairs(image: Grid, algo: Grid, pairs: int) -> Grid:
+    boundary_condition = algo[0]
+    for _ in range(pairs):
+        image = enhance(enhance(image, algo, 0), algo, boundary_condition)
+    return image
+
+
+def parse_input(raw_input: str) -> tuple[Grid, Grid]:
+    return parse_algo(raw_input)
+
+
+def part_1(puzzle_input: tuple[Grid, Grid]) -> int:
+    algorithm, image = puzzle_input
+    return int(np.sum(enhance_pairs(image, algorithm, 1)))
+
+
+def part_2(puzzle_input: tuple[Grid, Grid]) -> int:
+    algorithm, image = puzzle_input
+    return int(np.sum(enhance_pairs(image, algorithm, 25)))
+
+
+def solve(raw_input: str) -> tuple[int, int]:
+    puzzle_input = parse_input(raw_input)
+    return part_1(puzzle_input), part_2(puzzle_input)
 
 
 def main() -> None:
     with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
         raw_algo = f.read()
-    algorithm, image = parse_algo(raw_algo)
-    boundary_condition = algorithm[0]
-    enhanced = enhance(
-        enhance(image, algorithm, 0), algorithm, boundary_condition
-    )
+    puzzle_input = parse_input(raw_algo)
 
-    answer_1 = np.sum(enhanced)
+    answer_1 = part_1(puzzle_input)
     assert answer_1 == 5306
     print(answer_1)
 
-    for _ in range(24):
-        enhanced = enhance(
-            enhance(enhanced, algorithm, 0), algorithm, boundary_condition
-        )
-
-    answer_2 = np.sum(enhanced)
+    answer_2 = part_2(puzzle_input)
     assert answer_2 == 17497
     print(answer_2)
 
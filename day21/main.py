@@ -61,12 +61,7 @@ def mod(a: int, n: int) -> int:
     return ((a - 1) % n) + 1
 
 
-def main() -> None:
-    with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
-        raw_p1_start, raw_p2_start = f.readlines()
-    p1_start = parse_start(raw_p1_start)
-    p2_start = parse_start(raw_p2_start)
-
+def play_deterministic(p1_start: int, p2_start: int) -> int:
     player_states = {
         1: (p1_start, 0),
         2: (p2_start, 0),
@@ -84,10 +79,10 @@ def main() -> None:
             if score >= 1000:
                 break
 
-    answer_1 = min(score for _, score in player_states.values()) * d_count
-    assert answer_1 == 576600
-    print(answer_1)
+    return min(score for _, score in player_states.values()) * d_count
+
 
+def play_dirac(p1_start: int, p2_start: int) -> int:
     game_states: defaultdict[GameState, int] = defaultdict(int)
     game_states[GameState(
         p1_position=p1_start,
@@ -112,7 +107,37 @@ def main() -> None:
                     new_game_states[new_state] += new_multiplicity
         game_states = new_game_states
 
-    answer_2 = max(p1_wins, p2_wins)
+    return max(p1_wins, p2_wins)
+
+
+def parse_input(raw_input: str) -> tuple[int, int]:
+    raw_p1_start, raw_p2_start = raw_input.splitlines()
+    return parse_start(raw_p1_start), parse_start(raw_p2_start)
+
+
+def part_1(starts: tuple[int, int]) -> int:
+    return play_deterministic(*starts)
+
+
+def part_2(starts: tuple[int, int]) -> int:
+    return play_dirac(*starts)
+
+
+def solve(raw_input: str) -> tuple[int, int]:
+    puzzle_input = parse_input(raw_input)
+    return part_1(puzzle_input), part_2(puzzle_input)
+
+
+def main() -> None:
+    with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
+        raw_input = f.read()
+    starts = parse_input(raw_input)
+
+    answer_1 = part_1(starts)
+    assert answer_1 == 576600
+    print(answer_1)
+
+    answer_2 = part_2(starts)
     assert answer_2 == 131888061854776
     print(answer_2)
 
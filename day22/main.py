@@ -1,6 +1,9 @@
 from dataclasses import dataclass
 from itertools import pairwise
 import os.path
+from typing import Iterable
+
+from aoc.loader import read_lines
 
 SCRIPT_DIR = os.path.dirname(os.path.relpath(__file__))
 
@@ -105,26 +108,45 @@ def apply_instruction(cubes: set[Cube], instruction: Instruction) -> set[Cube]:
     return new_cubes
 
 
-def main() -> None:
-    with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
-        raw_instructions = f.readlines()
-    instructions = [
+def reboot(instructions: list[Instruction]) -> int:
+    cubes: set[Cube] = set()
+    for instruction in instructions:
+        cubes = apply_instruction(cubes, instruction)
+    return sum(cube.size() for cube in cubes)
+
+
+def parse_lines(raw_lines: Iterable[str]) -> list[Instruction]:
+    return [
         parse_instruction(raw_instruction)
-        for raw_instruction in raw_instructions
+        for raw_instruction in raw_lines
     ]
-    cubes: set[Cube] = set()
 
-    for instruction in instructions[:20]:
-        cubes = apply_instruction(cubes, instruction)
 
-    answer_1 = sum(cube.size() for cube in cubes)
+def parse_input(raw_input: str) -> list[Instruction]:
+    return parse_lines(raw_input.splitlines())
+
+
+def part_1(instructions: list[Instruction]) -> int:
+    return reboot(instructions[:20])
+
+
+def part_2(instructions: list[Instruction]) -> int:
+    return reboot(instructions)
+
+
+def solve(raw_input: str) -> tuple[int, int]:
+    puzzle_input = parse_input(raw_input)
+    return part_1(puzzle_input), part_2(puzzle_input)
+
+
+def main() -> None:
+    instructions = parse_lines(read_lines(f'{SCRIPT_DIR}/input.txt'))
+
+    answer_1 = part_1(instructions)
     assert answer_1 == 551693
     print(answer_1)
 
-    for instruction in instructions[20:]:
-        cubes = apply_instruction(cubes, instruction)
-
-    answer_2 = sum(cube.size() for cube in cubes)
+    answer_2 = part_2(instructions)
     assert answer_2 == 1165737675582132
     print(answer_2)
 